@@ -1 +1,18 @@
-from .cli import main, daemon, serve  # noqa: F401
+#
+# command-line entry points are loaded lazily: task programs importing
+# the library's task interface (fate.task) needn't import the CLI
+#
+_CLI_NAMES = frozenset(('main', 'daemon', 'serve'))
+
+
+def __dir__():
+    members = globals().keys() | _CLI_NAMES
+    return sorted(members)
+
+
+def __getattr__(name):
+    if name in _CLI_NAMES:
+        from . import cli
+        return getattr(cli, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
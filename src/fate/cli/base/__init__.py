@@ -1,3 +1,3 @@
-from .common import exit_on_error                  # noqa: F401
+from .common import CommandStatus, exit_on_error   # noqa: F401
 from .execution import CompletedDebugTask, runcmd  # noqa: F401
 from .main import Main                             # noqa: F401
@@ -19,21 +19,44 @@ class ExitOnError:
         if exc_type is None:
             return
 
-        if issubclass(exc_type, fate.conf.MultiConfError):
-            paths = ', '.join(exc_value.paths)
-            self.parser.exit(64, f'{self.parser.prog}: error: multiple configuration file '
-                                 f'formats at overlapping paths: {paths}\n')
-
-        if issubclass(exc_type, fate.conf.ConfSyntaxError):
-            self.parser.exit(65, f'{self.parser.prog}: error: could not decode '
-                                 f'{exc_value.format.upper()}: {exc_value.decode_err}\n')
-
-        if issubclass(exc_type, fate.conf.NoConfError):
-            self.parser.exit(72, f'{self.parser.prog}: error: missing '
-                                 f'configuration file (tried: {exc_value})\n')
-
-        if issubclass(exc_type, (fate.conf.ConfTypeError, fate.conf.ConfValueError)):
-            self.parser.exit(78, f'{self.parser.prog}: error: {exc_value}\n')
+        try:
+            handler = self._handlers_[exc_type]
+        except KeyError:
+            # not an exact match: fall back to subclass checks
+            for (handled_type, handler) in self._handlers_.items():
+                if issubclass(exc_type, handled_type):
+                    break
+            else:
+                return
+
+        handler(self, exc_value)
+
+    def _exit_multi_conf_(self, exc_value):
+        paths = ', '.join(exc_value.paths)
+        self.parser.exit(64, f'{self.parser.prog}: error: multiple configuration file '
+                             f'formats at overlapping paths: {paths}\n')
+
+    def _exit_conf_syntax_(self, exc_value):
+        self.parser.exit(65, f'{self.parser.prog}: error: could not decode '
+                             f'{exc_value.format.upper()}: {exc_value.decode_err}\n')
+
+    def _exit_no_conf_(self, exc_value):
+        self.parser.exit(72, f'{self.parser.prog}: error: missing '
+                             f'configuration file (tried: {exc_value})\n')
+
+    def _exit_conf_invalid_(self, exc_value):
+        self.parser.exit(78, f'{self.parser.prog}: error: {exc_value}\n')
+
+    # mapping of handled exception classes to their handlers
+    #
+    # (exact classes are looked up directly; subclasses are matched in order)
+    _handlers_ = {
+        fate.conf.MultiConfError: _exit_multi_conf_,
+        fate.conf.ConfSyntaxError: _exit_conf_syntax_,
+        fate.conf.NoConfError: _exit_no_conf_,
+        fate.conf.ConfTypeError: _exit_conf_invalid_,
+        fate.conf.ConfValueError: _exit_conf_invalid_,
+    }
 
 
 def exit_on_error(method):
@@ -54,68 +77,83 @@ def exit_on_error(method):
     return wrapped
 
 
-class CommandInterface:
+class CommandStatus(enum.Enum):
+    """Status categories of task command return codes."""
 
-    class CommandStatus(enum.Enum):
-        """Status categories of task command return codes."""
+    # typical exit codes
+    Retry = 42  # framework-specific
+    OK = 0
 
-        # typical exit codes
-        Retry = 42  # framework-specific
-        OK = 0
+    # termination by signal
+    Killed = -9
+    Terminated = -15
 
-        # termination by signal
-        Killed = -9
-        Terminated = -15
+    # meta-statuses for erroneous exits
+    Unrecognized = -997
+    Timeout = -998
+    Error = -999
 
-        # meta-statuses for erroneous exits
-        Unrecognized = -997
-        Timeout = -998
-        Error = -999
+    @classonlymethod
+    @functools.lru_cache(maxsize=256)
+    def select(cls, code):
+        """Retrieve appropriate status for given return code.
 
-        @classonlymethod
-        def select(cls, code):
-            """Retrieve appropriate status for given return code."""
-            value = int(code)
+        Results are cached, such that repeated look-ups of
+        unrecognized codes needn't repeatedly raise and handle
+        ValueError.
 
-            try:
-                return cls(value)
-            except ValueError:
-                return cls.Error if value > 0 else cls.Unrecognized
+        """
+        value = int(code)
 
-        @classonlymethod
-        def assign(cls, code, stopped=False):
-            """Retrieve appropriate status given return code and whether
-            a Timeout stop was issued.
+        try:
+            return cls(value)
+        except ValueError:
+            return cls.Error if value > 0 else cls.Unrecognized
 
-            """
-            status = cls.select(code)
-            return cls.Timeout if stopped and status.stoppage else status
+    @classonlymethod
+    def assign(cls, code, stopped=False):
+        """Retrieve appropriate status given return code and whether
+        a Timeout stop was issued.
 
-        @property
-        def erroneous(self) -> bool:
-            return self.value < 0
+        """
+        status = cls.select(code)
+        return cls.Timeout if stopped and status.stoppage else status
+
+    @property
+    def erroneous(self) -> bool:
+        return self.value < 0
+
+    @property
+    def stoppage(self) -> bool:
+        return -100 < self.value < 0
 
-        @property
-        def stoppage(self) -> bool:
-            return -100 < self.value < 0
+    def __str__(self):
+        return self.name
 
-        def __str__(self):
-            return self.name
+
+class CommandInterface:
+
+    CommandStatus = CommandStatus
 
     @property
     def conf(self):
+        try:
+            return self.__dict__['conf']
+        except KeyError:
+            pass
+
         if (root := self.root) is None:
-            # this is the root command
-            # retrieve and store conf here
-            try:
-                conf = self.__dict__['conf']
-            except KeyError:
-                conf = self.__dict__['conf'] = self.args.__conf__ or fate.conf.get()
+            # this is the root command: retrieve conf here
+            conf = self.args.__conf__ or fate.conf.get()
+        else:
+            # defer to root
+            conf = root.conf
 
-            return conf
+        # store conf on each command, (root or otherwise), such that
+        # subsequent look-ups needn't traverse the command tree
+        self.__dict__['conf'] = conf
 
-        # defer to root
-        return root.conf
+        return conf
 
     @property
     def exit_on_error(self):
@@ -123,16 +161,18 @@ class CommandInterface:
 
     @staticmethod
     def write_result(path: pathlib.Path, contents: bytes):
-        if path.exists():
-            raise FileExistsError(path)
-
-        if not path.parent.exists():
-            try:
-                path.parent.mkdir(parents=True)
-            except NotADirectoryError:
-                pass
-
-        if not path.parent.is_dir():
-            raise NotADirectoryError(20, 'Not a directory', path.parent)
-
-        path.write_bytes(contents)
+        # open exclusively -- raising FileExistsError -- and only create
+        # parent directories upon failure to open (rather than stat-ing
+        # the path and its parent up front)
+        try:
+            file = path.open('xb')
+        except FileNotFoundError:
+            # parent directory missing: create it and retry
+            #
+            # (NotADirectoryError propagates from either operation should
+            # the parent or any of its ancestors be other than a directory)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            file = path.open('xb')
+
+        with file:
+            file.write(contents)
@@ -34,6 +34,9 @@ class OneOffExecutor(CommandInterface, argcmdr.Command):
         format_result: typing.Sequence[str] = ('auto',)
         timeout: typing.Optional[int] = None
 
+    # Regular expression with which to detect whitespace in program name
+    whitespace_pattern = re.compile(r'\s')
+
     @staticmethod
     def snip_many(iterable, maxlen, cast=str):
         contents = ', '.join(cast(item) for item in iterable)
@@ -42,21 +45,44 @@ class OneOffExecutor(CommandInterface, argcmdr.Command):
         return f'({contents})'
 
     @staticmethod
-    def print_output(name, text):
+    def write_file(file: typing.BinaryIO, data: bytes):
+        """Write bytes to the given binary file and close it.
+
+        Standard output (as opened by `FileType` for path `-`) is
+        flushed rather than closed.
+
+        """
+        file.write(data)
+
+        if file is sys.stdout.buffer:
+            file.flush()
+        else:
+            file.close()
+
+    @staticmethod
+    def format_output(name, text):
+        """Format report value text appropriately for its length
+        (number of lines).
+
+        """
+        if '\n' in text:
+            return f'{name}:\n\n{textwrap.indent(text.strip(), "  ")}\n'
+
+        return f'{name}: {text}\n'
+
+    @classmethod
+    def print_output(cls, name, text):
         """Print report value text formatted appropriately for its
         length (number of lines).
 
         """
-        if '\n' in text:
-            print(f'{name}:', textwrap.indent(text.strip(), '  '), sep='\n\n')
-        else:
-            print(f'{name}:', text)
+        sys.stdout.write(cls.format_output(name, text))
 
     @staticmethod
     def present_outputs(outputs):
         for task_output in outputs:
             if task_output.label:
-                label = '{}{}'.format(task_output.label, task_output.ext)
+                label = f'{task_output.label}{task_output.ext}'
             elif task_output.ext:
                 label = f'[{task_output.ext}]'
             else:
@@ -68,40 +94,32 @@ class OneOffExecutor(CommandInterface, argcmdr.Command):
                 text = "<non-text output>"
 
             if '\n' in text:
-                yield label + '\n\n' + textwrap.indent(text, '  ')
+                yield f'{label}\n\n{textwrap.indent(text, "  ")}'
             else:
                 yield f'{label}: {text}'
 
     @classmethod
     def print_report(cls, command, retcode, outputs, stderr, error):
         """Print a report of task command execution outcomes."""
-        print('Name:', command.name or '-')
-
-        print()
-
-        cls.print_output('Command', ' '.join(command.args))
-
-        print()
-
         if error:
             if isinstance(error, subprocess.TimeoutExpired):
-                status = ('Timeout', f'({error.timeout}s)')
+                status = f'Timeout ({error.timeout}s)'
             else:
                 raise NotImplementedError(error)
         else:
-            status = (cls.CommandStatus.select(retcode), f'(Exit code {retcode})')
-
-        print('Status:', *status)
-
-        print()
+            status = f'{cls.CommandStatus.select(retcode)} (Exit code {retcode})'
 
         output = '\n\n'.join(cls.present_outputs(outputs))
 
-        cls.print_output('Result', output or '-')
+        # report sections are separated by blank lines and written at once
+        sections = [
+            f"Name: {command.name or '-'}\n",
+            cls.format_output('Command', ' '.join(command.args)),
+            f'Status: {status}\n',
+            cls.format_output('Result', output or '-'),
+        ]
 
         if stderr:
-            print()
-
             try:
                 logs = stderr.decode()
             except UnicodeDecodeError:
@@ -110,7 +128,9 @@ class OneOffExecutor(CommandInterface, argcmdr.Command):
                 # make fate task logging separators -- null byte -- visual
                 stderr_formatted = logs.replace('\0', '\n\n').strip() + '\n'
 
-            cls.print_output('Logged (standard error)', stderr_formatted)
+            sections.append(cls.format_output('Logged (standard error)', stderr_formatted))
+
+        sys.stdout.write('\n'.join(sections))
 
     def __init__(self, parser):
         super().__init__(parser)
@@ -118,13 +138,13 @@ class OneOffExecutor(CommandInterface, argcmdr.Command):
         parser.add_argument(
             '-o', '--stdout',
             metavar='path',
-            type=argparse.FileType('w'),
+            type=argparse.FileType('wb'),
             help="write command result to path",
         )
         parser.add_argument(
             '-e', '--stderr',
             metavar='path',
-            type=argparse.FileType('w'),
+            type=argparse.FileType('wb'),
             help="write command standard error to path",
         )
         parser.add_argument(
@@ -150,7 +170,7 @@ class OneOffExecutor(CommandInterface, argcmdr.Command):
 
             if executable is None:
                 hint = ('\nhint: whitespace in program name suggests a misconfiguration'
-                        if re.search(r'\s', program) else '')
+                        if self.whitespace_pattern.search(program) else '')
                 parser.exit(127, f'{parser.prog}: error: {program}: '
                                  f'command not found on path{hint}\n')
 
@@ -166,7 +186,7 @@ class OneOffExecutor(CommandInterface, argcmdr.Command):
 
                     # it's assumed that even if stdin is set to a TTY it's purposeful
                     # here; so, indicate to task.param.read() not to worry about it:
-                    env=dict(os.environ, FATE_READ_TTY_PARAM='1'),
+                    env={**os.environ, 'FATE_READ_TTY_PARAM': '1'},
                 )
             except subprocess.TimeoutExpired as exc:
                 result = None
@@ -203,15 +223,13 @@ class OneOffExecutor(CommandInterface, argcmdr.Command):
                     raise ValueError("get_command() generated more than one command")
 
             if args.stdout:
-                args.stdout.write(stdout)
-                stdout = f'[See {args.stdout.name}]'
+                self.write_file(args.stdout, stdout)
+                stdout = f'[See {args.stdout.name}]'.encode()
                 outputs = (TaskOutput(stdout, '<stored>'),)
-                args.stdout.close()
 
             if args.stderr:
-                args.stderr.write(stderr)
-                stderr = f'[See {args.stderr.name}]'
-                args.stderr.close()
+                self.write_file(args.stderr, stderr)
+                stderr = f'[See {args.stderr.name}]'.encode()
 
             if args.report:
                 self.print_report(command, returncode, outputs, stderr, error)
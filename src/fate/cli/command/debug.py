@@ -19,13 +19,23 @@ def path_to_bytes(value: str) -> bytes:
     reading a file at that path (via `FileType`).
 
     """
-    if not value.startswith('{') and '\n' not in value and (
-        value == '-' or os.path.sep in value or os.path.exists(value)
-    ):
+    if value.startswith('{') or '\n' in value:
+        return value.encode()
+
+    if value == '-' or os.path.sep in value:
         with READABLE(value) as file:
             return file.read()
 
-    return value.encode()
+    # value *may* be a path: rather than stat it, attempt to open it
+    try:
+        file = open(value, 'rb')
+    except FileNotFoundError:
+        return value.encode()
+    except OSError as exc:
+        raise argparse.ArgumentTypeError(f"can't open '{value}': {exc}")
+
+    with file:
+        return file.read()
 
 
 @Main.register
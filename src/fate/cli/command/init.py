@@ -1,12 +1,15 @@
 import abc
 import enum
+import functools
+import hashlib
+import json
 import os
 import sys
+import typing
 from dataclasses import dataclass
+from importlib import metadata
 from pathlib import Path
 
-import argcomplete
-
 from fate.conf.template import render_str
 from fate.util.abstract import abstractmember
 from fate.util.argument import ChoiceMapping, DirAccess, FileAccess
@@ -20,33 +23,45 @@ from plumbum import colors
 from .. import exit_on_error, Main
 
 
-class StatusSymbol(StrEnum):
+class StatusSymbol:
 
-    complete   = colors.bold & colors.success | '☑'  # noqa: E221
-    failed     = colors.bold & colors.fatal   | '☒'  # noqa: E221
-    incomplete = colors.bold & colors.info    | '☐'  # noqa: E221
+    complete   = str(colors.bold & colors.success | '☑')  # noqa: E221
+    failed     = str(colors.bold & colors.fatal   | '☒')  # noqa: E221
+    incomplete = str(colors.bold & colors.info    | '☐')  # noqa: E221
 
 
-class EndStatus(enum.Enum):
+class Status(typing.NamedTuple):
 
-    complete   = (StatusSymbol.complete,   'installed')  # noqa: E221,E241
-    failed     = (StatusSymbol.failed,     'failed')     # noqa: E221,E241
-    incomplete = (StatusSymbol.incomplete, 'skipped')    # noqa: E221,E241
+    symbol: str
+    message: str
 
-    @property
-    def symbol(self):
-        return self.value[0]
 
-    @property
-    def message(self):
-        return self.value[1]
+class EndStatus:
+
+    complete   = Status(StatusSymbol.complete,   'installed')  # noqa: E221,E241
+    failed     = Status(StatusSymbol.failed,     'failed')     # noqa: E221,E241
+    incomplete = Status(StatusSymbol.incomplete, 'skipped')    # noqa: E221,E241
+
+
+TASK_SYMBOLS = {
+    'comp': str(colors.bold | '↹'),
+    'conf': str(colors.bold | '⚙'),
+    'serv': str(colors.bold | '↬'),
+}
+
 
+PROMPT_ANSWERS = {
+    'y': 'y',
+    'n': 'n',
 
-class TaskSymbol(StrEnum):
+    # set empty
+    '\r': 'y',
 
-    comp = colors.bold | '↹'
-    conf = colors.bold | '⚙'
-    serv = colors.bold | '↬'
+    # treat ^C, ^D and end of input as input of "n"
+    '\x03': 'n',
+    '\x04': 'n',
+    '': 'n',
+}
 
 
 @dataclass
@@ -114,15 +129,17 @@ class InitCommand(Main, metaclass=abc.ABCMeta):
 
         if isinstance(prompt, NoTask):
             print(StatusSymbol.failed,
-                  TaskSymbol[prompt.identifier],
+                  TASK_SYMBOLS[prompt.identifier],
                   prompt.description,
                   sep='  ')
 
             return
 
+        path = str(prompt.path)
+
         print(StatusSymbol.complete if prompt.syncd else StatusSymbol.incomplete,
-              TaskSymbol[prompt.identifier],
-              colors.underline & colors.dim | str(prompt.path),
+              TASK_SYMBOLS[prompt.identifier],
+              colors.underline & colors.dim | path,
               sep='  ')
 
         lines = 1
@@ -137,31 +154,24 @@ class InitCommand(Main, metaclass=abc.ABCMeta):
                 end='\r',  # return
             )
 
-            while (do_install := getch().lower()) not in 'yn\r\x03\x04':
+            while (do_install := PROMPT_ANSWERS.get(getch().lower())) is None:
                 pass
 
-            if do_install == '\r':
-                # set empty
-                do_install = 'y'
-            elif do_install in '\x03\x04':
-                # treat ^C and ^D as input of "n"
-                do_install = 'n'
-
             print(colors.underline | do_install.upper())
         else:
             do_install = 'y'
 
         status = executor.send(do_install == 'y')
 
-        # update status line
-        print(
-            f'\033[{lines}F',                                     # jump to ☐
-            status.symbol,                                        # reset symbol
-            '\033[{}C'.format(5 + len(str(prompt.path))),         # jump to end
-            f': {prompt.description} {status.message}',           # set message
-            sep='',
-            end=('\n' * lines),                                   # return to bottom
+        # update status line (in a single write)
+        sys.stdout.write(
+            f'\033[{lines}F'                                      # jump to ☐
+            f'{status.symbol}'                                    # reset symbol
+            f'\033[{5 + len(path)}C'                              # jump to end
+            f': {prompt.description} {status.message}'            # set message
+            + '\n' * lines                                        # return to bottom
         )
+        sys.stdout.flush()
 
 
 @Main.register
@@ -305,10 +315,12 @@ class Comp(InitCommand):
         tcsh = 'tcsh'
 
         @classmethod
+        @functools.lru_cache(maxsize=None)
         def get_choices(cls):
-            return sorted(str(member) for member in cls)
+            return tuple(sorted(str(member) for member in cls))
 
         @classmethod
+        @functools.lru_cache(maxsize=None)
         def get_default(cls):
             login_shell = os.getenv('SHELL')
 
@@ -357,6 +369,89 @@ class Comp(InitCommand):
             help="force installation to file at path (default: inferred)",
         )
 
+        parser.add_argument(
+            '--cache',
+            default=True,
+            action=BooleanOptionalAction,
+            help="consult and update the cache of completion code and installation "
+                 "fingerprints (default: cache)",
+        )
+
+    @property
+    def cache_path(self):
+        return self.conf._prefix_.cache / 'comp'
+
+    @property
+    def manifest_path(self):
+        return self.cache_path / 'manifest.json'
+
+    def read_manifest(self):
+        """Read the mapping of installation paths to the fingerprints
+        of the files written to them.
+
+        """
+        try:
+            with self.manifest_path.open() as fd:
+                manifest = json.load(fd)
+        except (OSError, ValueError):
+            return {}
+
+        # disregard a manifest of unexpected structure
+        return manifest if isinstance(manifest, dict) else {}
+
+    def write_manifest(self, manifest):
+        self.write_cache(self.manifest_path, json.dumps(manifest))
+
+    def write_cache(self, path, contents):
+        """Write the given contents to the cache file at the given path.
+
+        The file is replaced atomically, such that an interrupted write
+        cannot leave a partial file in the cache.
+
+        """
+        temp_path = path.with_suffix('.tmp')
+
+        try:
+            self.cache_path.mkdir(parents=True, exist_ok=True)
+            temp_path.write_text(contents)
+            os.replace(temp_path, path)
+        except OSError:
+            # cache is merely an optimization
+            pass
+
+    @staticmethod
+    def fingerprint(path, digest):
+        stat = path.stat()
+        return [stat.st_mtime_ns, stat.st_size, digest]
+
+    def get_shellcode(self, entry_points, shell, cache=True):
+        """Retrieve completion code for the given entry points and shell.
+
+        Generated code is cached under the cache prefix, keyed by the
+        entry points, shell and version of argcomplete, such that it
+        needn't be regenerated upon each invocation.
+
+        """
+        version = metadata.version('argcomplete')
+        signature = '\0'.join((shell, version, *entry_points))
+        cache_key = hashlib.sha256(signature.encode()).hexdigest()[:16]
+        cache_path = self.cache_path / f'{shell}-{cache_key}'
+
+        if cache:
+            try:
+                return cache_path.read_text()
+            except OSError:
+                pass
+
+        import argcomplete
+
+        contents = argcomplete.shellcode(entry_points, shell=shell)
+
+        if cache:
+            self.write_cache(cache_path, contents)
+
+        return contents
+
     def execute(self, args):
         """install shell completion"""
         # determine installation path
@@ -371,35 +466,54 @@ class Comp(InitCommand):
         entry_points = args.__entry_points__ or [f'{self.conf._lib_}{suffix}'
                                                  for suffix in self.script_suffixes]
 
-        contents = argcomplete.shellcode(entry_points, shell=args.shell)
+        contents = self.get_shellcode(entry_points, args.shell, args.cache)
 
         # check file status and prepare prompt
         prompt = PathUpdate('comp', f'{args.shell} {self.description}', completions_path)
 
+        # the installed file needn't be read if it's as we last wrote it
+        encoded = contents.encode()
+        digest = hashlib.sha256(encoded).hexdigest()
+        manifest = self.read_manifest() if args.cache else {}
+        recorded = manifest.get(str(completions_path))
+
         try:
-            prompt.syncd = completions_path.read_text() == contents
+            fingerprint = self.fingerprint(completions_path, digest)
         except FileNotFoundError:
             prompt.exists = prompt.syncd = False
         else:
+            (_mtime, size, _digest) = fingerprint
+
+            # otherwise compare sizes before bothering to read
             prompt.exists = True
+            prompt.syncd = recorded == fingerprint or (
+                size == len(encoded) and completions_path.read_bytes() == encoded
+            )
 
         # delegate prompt to controller
         confirmed = yield prompt
 
         # complete execution
         if prompt.syncd:
-            yield EndStatus.complete
+            status = EndStatus.complete
         elif confirmed:
             try:
                 completions_path.parent.mkdir(parents=True,
                                               exist_ok=True)
-                completions_path.write_text(contents)
+                completions_path.write_bytes(encoded)
+                fingerprint = self.fingerprint(completions_path, digest)
             except OSError:
-                yield EndStatus.failed
+                status = EndStatus.failed
             else:
-                yield EndStatus.complete
+                status = EndStatus.complete
         else:
-            yield EndStatus.incomplete
+            status = EndStatus.incomplete
+
+        if args.cache and status is EndStatus.complete and recorded != fingerprint:
+            manifest[str(completions_path)] = fingerprint
+            self.write_manifest(manifest)
+
+        yield status
 
 
 @Init.register
@@ -18,20 +18,37 @@ class LogReader:
     stream: typing.Union[bytes, BufferedOutput]
     position: int = field(default=0, init=False)
 
+    _record_pattern = re.compile(rb'(?P<record>[^\0]+)\0+')
+
+    @property
+    def data(self) -> typing.Union[bytes, bytearray]:
+        return getattr(self.stream, 'data', self.stream)
+
     @property
     def buffer(self) -> bytes:
-        return bytes(self.stream)[self.position:]
+        # copy only the unread portion of the stream's data
+        # (rather than all of its data and then the unread portion)
+        with memoryview(self.data) as view:
+            return view[self.position:].tobytes()
 
     def read(self, final=False):
-        position = self.position
-
-        for match in re.finditer(rb'(?P<record>[^\0]+)\0+', self.buffer):
-            self.position = position + match.end()
-            yield match['record']
+        # scan the stream's data in place from the read position: only
+        # records themselves are copied out
+        #
+        # records are collected before any is yielded: the scan holds an export
+        # of the (growable) data, which must be released before the stream may
+        # again receive
+        records = []
+
+        for match in self._record_pattern.finditer(self.data, self.position):
+            self.position = match.end()
+            records.append(match['record'])
 
         if final and (rem := self.buffer):
             self.position += len(rem)
-            yield rem
+            records.append(rem)
+
+        yield from records
 
 
 class LogRecord(typing.NamedTuple):
@@ -1,5 +1,6 @@
 """In-memory access to supported configuration files."""
-from types import SimpleNamespace
+import functools
+import os
 
 from descriptors import cachedproperty
 
@@ -21,6 +22,41 @@ from ..error import (
 )
 
 
+@functools.lru_cache(maxsize=None)
+def builtin_files(package):
+    """Retrieve the (shared) resource root of the given package of
+    built-in configuration.
+
+    """
+    return resources.files(package)
+
+
+class ConfSiblings:
+    """Attribute access to the other members of a Conf's group.
+
+    The mapping of members may be shared by all members of the group --
+    the owning Conf is excluded by name.
+
+    """
+    __slots__ = ('_name_', '_members_')
+
+    def __init__(self, name, members):
+        self._name_ = name
+        self._members_ = members
+
+    def __getattr__(self, name):
+        if name != self._name_:
+            try:
+                return self._members_[name]
+            except KeyError:
+                pass
+
+        raise AttributeError(f"'{self.__class__.__name__}' object has no attribute {name!r}")
+
+    def __dir__(self):
+        return [name for name in self._members_ if name != self._name_]
+
+
 class Conf(AttributeAccessMap, NestingConf, LazyLoadProxyMapping):
     """Dictionary- and object-style access to a configuration file."""
 
@@ -31,7 +67,7 @@ class Conf(AttributeAccessMap, NestingConf, LazyLoadProxyMapping):
         dict_ = AttributeDict
         list_ = list
 
-    def __init__(self, name, lib, builtin, paths, filename=None, types=None, **others):
+    def __init__(self, name, lib, builtin, paths, filename=None, types=None, group=None):
         super().__init__()
 
         self.__name__ = name
@@ -44,7 +80,7 @@ class Conf(AttributeAccessMap, NestingConf, LazyLoadProxyMapping):
 
         self._types_ = types
 
-        self.__other__ = SimpleNamespace(**others)
+        self.__other__ = ConfSiblings(name, {} if group is None else group)
 
     def __repr__(self):
         if self.__filename__ == f"{self.__name__}s":
@@ -66,11 +102,13 @@ class Conf(AttributeAccessMap, NestingConf, LazyLoadProxyMapping):
     @cachedproperty
     @loads
     def _indicator_builtin_(self):
-        return resources.files(self._builtin_.path) / self.__filename__
+        return builtin_files(self._builtin_.path) / self.__filename__
 
     def _iter_builtins_(self):
-        for format_ in self._Format:
-            builtin_path = self._indicator_builtin_.with_suffix(format_.suffix)
+        indicator = self._indicator_builtin_
+
+        for suffix in self._Format.suffixes:
+            builtin_path = indicator.with_suffix(suffix)
 
             if builtin_path.is_file():
                 yield builtin_path
@@ -78,10 +116,29 @@ class Conf(AttributeAccessMap, NestingConf, LazyLoadProxyMapping):
     def _iter_paths_(self, prefix=None):
         indicator = prefix / self.__filename__ if prefix else self._indicator_
 
-        for format_ in self._Format:
-            path = indicator.with_suffix(format_.suffix)
+        # list the prefix directory once rather than stat each candidate
+        try:
+            with os.scandir(indicator.parent) as entries:
+                names = {entry.name for entry in entries if entry.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            return
+        except PermissionError:
+            # prefix is searchable but not readable: stat each candidate
+            names = None
+        else:
+            folded = {name.casefold() for name in names}
 
-            if path.is_file():
+        for suffix in self._Format.suffixes:
+            path = indicator.with_suffix(suffix)
+
+            if names is not None and path.name in names:
+                yield path
+            elif (
+                # names differing only in case may yet match (on a case-insensitive
+                # file system): defer to the file system
+                (names is None or path.name.casefold() in folded)
+                and path.is_file()
+            ):
                 yield path
 
     def _get_path_(self, prefix=None):
@@ -110,7 +167,7 @@ class Conf(AttributeAccessMap, NestingConf, LazyLoadProxyMapping):
 
         raise NoConfError("%s{%s}" % (
             self._indicator_,
-            ','.join(format_.suffix for format_ in self._Format),
+            ','.join(self._Format.suffixes),
         ))
 
     @property
@@ -63,6 +63,8 @@ class ConfGroup:
         default = ConfSpec('default', conf=DefaultConf, types={'dict': DefaultConfDict,
                                                                'list': DefaultConfList})
 
+    _specs_ = tuple(_Spec)
+
     class _Default(StrEnum):
 
         lib = 'fate'
@@ -72,18 +74,20 @@ class ConfGroup:
 
         self._builtin_ = BuiltinConfSpec._from_group(**builtin_spec)
 
-        data = dict(self._iter_conf_(specs))
-        self.__dict__.update(data)
-        self._names_ = tuple(data)
+        # members share a single mapping through which to find one another
+        members = {}
+
+        for (name, conf) in self._iter_conf_(specs, members):
+            members[name] = self.__dict__[name] = conf
 
-        self._link_conf_()
+        self._names_ = tuple(members)
 
     @cachedproperty
     def _prefix_(self):
         return PrefixPaths.infer(self._lib_)
 
-    def _iter_conf_(self, specs):
-        for spec in (specs or self._Spec):
+    def _iter_conf_(self, specs, group):
+        for spec in (specs or self._specs_):
             if isinstance(spec, str):
                 spec = (spec, None, None, Conf)
 
@@ -98,20 +102,10 @@ class ConfGroup:
                     self._prefix_,
                     file_name,
                     types,
+                    group,
                 )
             )
 
-    def _link_conf_(self):
-        for name0 in self._names_:
-            conf0 = getattr(self, name0)
-
-            for name1 in self._names_:
-                if name1 == name0:
-                    continue
-
-                conf1 = getattr(self, name1)
-                setattr(conf0.__other__, name1, conf1)
-
     def __iter__(self):
         for name in self._names_:
             yield getattr(self, name)
@@ -16,6 +16,34 @@ from descriptors import cachedproperty, classonlymethod, classproperty
 from fate.util.os import system_path
 
 
+@functools.lru_cache(maxsize=None)
+def installed_system():
+    """Whether this library appears installed under a system path.
+
+    (The installation's location is fixed for the life of the process,
+    and so is inferred only once.)
+
+    """
+    return bool(system_path(Path(__file__)))
+
+
+@functools.lru_cache(maxsize=None)
+def xdg_path(variable, *default):
+    """Path given by the XDG environment variable of the given name or
+    otherwise constructed from the given default parts relative to
+    the user home directory.
+
+    (The user's base directories are not expected to change over the
+    life of the process, and so are resolved only once -- see
+    `xdg_path.cache_clear`.)
+
+    """
+    if value := os.getenv(variable):
+        return Path(value)
+
+    return Path.home().joinpath(*default)
+
+
 class PrefixProfile(enum.Flag):
 
     #
@@ -84,7 +112,7 @@ class PrefixProfile(enum.Flag):
         # (and so will use XDG_CONFIG_HOME, etc.)
         # OR appears global
         # (and so will install global)
-        location_profile = cls.system if system_path(Path(__file__)) else cls.empty
+        location_profile = cls.system if installed_system() else cls.empty
 
         if (
             # using system python
@@ -162,10 +190,7 @@ class PrefixPaths:
         if PrefixProfile.isolated in self.profile:
             return Path(sys.prefix)
 
-        if xdg_config := os.getenv('XDG_CONFIG_HOME'):
-            return Path(xdg_config)
-
-        return Path.home() / '.config'
+        return xdg_path('XDG_CONFIG_HOME', '.config')
 
     @path.property
     def data(self):
@@ -176,10 +201,7 @@ class PrefixPaths:
         if PrefixProfile.isolated in self.profile:
             return Path(sys.prefix)
 
-        if xdg_data := os.getenv('XDG_DATA_HOME'):
-            return Path(xdg_data)
-
-        return Path.home() / '.local' / 'share'
+        return xdg_path('XDG_DATA_HOME', '.local', 'share')
 
     @path.property
     def state(self):
@@ -190,10 +212,7 @@ class PrefixPaths:
         if PrefixProfile.isolated in self.profile:
             return Path(sys.prefix)
 
-        if xdg_state := os.getenv('XDG_STATE_HOME'):
-            return Path(xdg_state)
-
-        return Path.home() / '.local' / 'state'
+        return xdg_path('XDG_STATE_HOME', '.local', 'state')
 
     @path.property
     def run(self):
@@ -204,10 +223,18 @@ class PrefixPaths:
         if PrefixProfile.isolated in self.profile:
             return Path(sys.prefix)
 
-        if xdg_runtime := os.getenv('XDG_RUNTIME_DIR'):
-            return Path(xdg_runtime)
+        return xdg_path('XDG_RUNTIME_DIR', '.local', 'run')
+
+    @path.property
+    def cache(self):
+        """regenerable artifacts (such as shell completion code)"""
+        if PrefixProfile.system in self.profile:
+            return Path(os.sep) / 'var' / 'cache'
+
+        if PrefixProfile.isolated in self.profile:
+            return Path(sys.prefix)
 
-        return Path.home() / '.local' / 'run'
+        return xdg_path('XDG_CACHE_HOME', '.cache')
 
     @path
     def completions(self, shell_name, force_system=None):
@@ -219,7 +246,4 @@ class PrefixPaths:
 
         # completions must ignore user virtual env (and shouldn't matter)
 
-        data_path = (Path(xdg_data) if (xdg_data := os.getenv('XDG_DATA_HOME'))
-                     else Path.home() / '.local' / 'share')
-
-        return data_path / dir_name / 'completions'
+        return xdg_path('XDG_DATA_HOME', '.local', 'share') / dir_name / 'completions'
@@ -15,8 +15,16 @@ environ.globals.update(
 variable_pattern = re.compile(r'{{(?P<expr>.*?)}}')
 
 
+# compilation dominates the cost of rendering; and, the strings of
+# (configured) templates and expressions are few and fixed -- so,
+# compilations are memoized.
+compile_expression = functools.lru_cache(maxsize=None)(environ.compile_expression)
+
+compile_template = functools.lru_cache(maxsize=None)(environ.from_string)
+
+
 def eval_expr(string, **context):
-    expr = environ.compile_expression(string)
+    expr = compile_expression(string)
     return expr(**context)
 
 
@@ -51,5 +59,5 @@ def render_str_list(contents, **context):
 
 
 def render_template(string, mapping=(), **context) -> str:
-    template = environ.from_string(string)
+    template = compile_template(string)
     return template.render(mapping, **context)
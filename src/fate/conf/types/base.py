@@ -1,3 +1,5 @@
+from descriptors import cachedproperty
+
 from fate.util.datastructure import (
     AttributeChainMap,
     AttributeProxyDict,
@@ -12,7 +14,7 @@ class ConfType(DecoratedNestedConf):
     This base does not provide the configuration's container class.
 
     """
-    @property
+    @cachedproperty
     def __lib__(self):
         return self.__root__.__lib__
 
@@ -3,6 +3,7 @@ import functools
 import os.path
 import pathlib
 import re
+import types
 import typing
 import uuid
 from datetime import datetime, timedelta
@@ -10,7 +11,7 @@ from enum import IntEnum
 
 import croniter
 import jinja2
-from descriptors import classproperty
+from descriptors import cachedproperty, classproperty
 
 from fate.util.compat.os import cpu_count
 from fate.util.compat.types import NoneType
@@ -39,6 +40,20 @@ from .base import (
 )
 
 
+class CachedCroniter(croniter.croniter):
+    """croniter memoizing the expansion of its cron expressions.
+
+    Expansion (parsing) dominates the cost of each croniter's
+    construction; yet, the expressions of tasks are fixed and evaluated
+    repeatedly.
+
+    """
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def expand(cls, expr_format, hash_id=None):
+        return super().expand(expr_format, hash_id=hash_id)
+
+
 class TaskConfType(ConfType):
     """Generic interface applied to data deserialized from task
     configuration files.
@@ -54,6 +69,11 @@ class TaskConfType(ConfType):
         result = 'auto'
         state = 'auto'
 
+    # plain (read-only) mapping of the above for lookup via format_
+    _default_format = types.MappingProxyType({
+        name: str(member) for (name, member) in _DefaultFormat.__members__.items()
+    })
+
     class _DefaultScheduling(IntEnum):
 
         tenancy = (2 * cpu_count() - 1)
@@ -148,7 +168,7 @@ class TaskConfType(ConfType):
             hash_id += f'.{uuid.getnode()}'
 
         # cover for croniter_range not directly supporting hash_id
-        croniter_ = functools.partial(croniter.croniter, hash_id=hash_id)
+        croniter_ = functools.partial(CachedCroniter, hash_id=hash_id)
 
         runs = (croniter_(schedule, t0, max_years_between_matches=max_years_between_matches)
                 if t1 is None
@@ -340,13 +360,14 @@ class TaskConfType(ConfType):
             )
 
     @at_depth(0)
-    @property
+    @cachedproperty
     def format_(self):
-        return collections.ChainMap(
-            self.get('format', {}),
-            self.__default__.get('format', {}),
-            self._DefaultFormat.__members__,
-        )
+        # (flattened: lookups needn't walk the layers of configuration)
+        return {
+            **self._default_format,
+            **self.__default__.get('format', {}),
+            **self.get('format', {}),
+        }
 
     @property
     def _default_path_result(self) -> str:
@@ -362,7 +383,7 @@ class TaskConfType(ConfType):
         )
 
     @at_depth(0)
-    @property
+    @cachedproperty
     @adopt('path')
     def path_(self):
         return TaskChainMap(
@@ -372,7 +393,7 @@ class TaskConfType(ConfType):
         )
 
     @at_depth(0)
-    @property
+    @cachedproperty
     def param_(self) -> str:
         param = self.get('param', {})
 
@@ -2,6 +2,8 @@ import itertools
 
 from fate.util.iteration import countas
 
+from .task import InvokedTask
+
 
 class TaskProcessPool:
     """A set-size, iterable collection of tasks launched for execution
@@ -96,8 +98,12 @@ class TaskProcessPool:
 
         count_ready = count_events = 0
 
-        for (index, task) in self.enumerate_tasks():
-            events = task.events_()
+        # check all tasks' pipes at once for those ready for I/O
+        slotted = list(self.enumerate_tasks())
+        ready = InvokedTask.select_(task for (_index, task) in slotted)
+
+        for (index, task) in slotted:
+            events = task.events_(ready)
 
             count_events += yield from countas(events.read())
 
@@ -112,6 +118,13 @@ class TaskProcessPool:
 
         return (count_ready, count_events)
 
+    def poll_hint(self):
+        """Seconds which may elapse before the pool's tasks should next
+        be polled.
+
+        """
+        return min((task.poll_hint_() for task in self.iter_tasks()), default=0.0)
+
     @property
     def active(self):
         try:
@@ -1,11 +1,13 @@
 import abc
 import hashlib
 import os
+import pathlib
 import typing
 
 from descriptors import cachedproperty, classproperty
 
 from fate.conf import ConfBracketError
+from fate.conf.path import PrefixProfile
 from fate.util.animals import animals
 from fate.util.iteration import storeresult
 
@@ -80,14 +82,21 @@ class TaskScheduler(Resets):
     def state(self):
         return TaskStateManager(self.path_state / 'state')
 
+    @property
+    def _debug_state_conf_(self):
+        if os.getenv(f'{self.conf._lib_}_DEBUG_STATE_CONF'.upper()) == '1':
+            return True
+
+        return PrefixProfile.isolated not in self.conf._prefix_.profile
+
     @cachedproperty
     def path_state(self):
         """Path to persistent state directory dedicated to the set of
         configuration files of this run.
 
         The state directory is ensured to be unique for each set of
-        configuration file paths, incorporating an MD5 hash in its base
-        name for this purpose.
+        configuration file paths, incorporating a (BLAKE2) hash in its
+        base name for this purpose.
 
         For the sake of user-friendliness, (or debugger-friendliness),
         a friendly name tag is prepended to this base name, as well.
@@ -104,52 +113,87 @@ class TaskScheduler(Resets):
         time -- these are ephemeral aides. Only the hash component of
         the directory name is used to identify it. Should a state
         directory's tag component diverge from the library's
-        expectation, it will be renamed appropriately.
+        expectation, it will be renamed appropriately. (Likewise, state
+        directories named for the legacy MD5 hash are migrated.)
 
-        Besides any data written by dependent components, all state
+        Besides any data written by dependent components, state
         directories are initialized to contain the subdirectory `conf/`.
         This subdirectory is non-functional and for the purpose of
         debugging. It will contain symbolic links to the configuration
         files of the runs for which the state directory was created.
 
+        For isolated installations -- under which state directories are
+        created directly within the (likely ephemeral) virtual
+        environment -- `conf/` is omitted, unless requested by the
+        process environment variable:
+
+            {LIB}_DEBUG_STATE_CONF=1
+
         """
-        # compute conf path-based signature and hash
-        signature = os.pathsep.join(sorted(str(conf.__path__) for conf in self.conf))
-        file_hash = hashlib.md5(signature.encode()).hexdigest()
+        # compute conf path-based hash
+        conf_paths = sorted(os.fsencode(conf.__path__) for conf in self.conf)
+        separator = os.fsencode(os.pathsep)
+
+        def hash_paths(hasher):
+            # feed paths to hasher in turn (without constructing their signature)
+            for (index, conf_path) in enumerate(conf_paths):
+                if index > 0:
+                    hasher.update(separator)
+
+                hasher.update(conf_path)
+
+            return hasher.hexdigest()
+
+        file_hash = hash_paths(hashlib.blake2b(digest_size=16))
 
         # add in deterministic (but non-unique) friendly name
         name_index = int(file_hash, 16) % len(animals)
         name = animals[name_index]
 
         # and you've got a friendly, unique path!
-        path_state = self.conf._prefix_.state / f"{name}-{file_hash}"
+        state_prefix = os.fspath(self.conf._prefix_.state)
+        path_state = pathlib.Path(os.path.join(state_prefix, f"{name}-{file_hash}"))
 
         # check for existing paths with a stale friendly name tag
-        if not path_state.exists():
-            candidates = (
-                (path, path.name.rsplit('-', 1)[-1])
-                for path in self.conf._prefix_.state.iterdir()
-                if path.is_dir()
-            )
-            matches = (path for (path, file_hash1) in candidates if file_hash1 == file_hash)
+        if not os.path.exists(path_state):
+            # (directories may also be named for the legacy hash of the signature)
+            suffixes = (f'-{file_hash}', f'-{hash_paths(hashlib.md5())}')
 
+            # list state dir once -- and check entries' names before their types
+            # (which scandir may report without further stat calls)
             try:
-                (collision, *extras) = matches
-            except (FileNotFoundError, ValueError):
+                with os.scandir(state_prefix) as entries:
+                    matches = [
+                        pathlib.Path(entry.path)
+                        for entry in entries
+                        if entry.name.endswith(suffixes) and entry.is_dir()
+                    ]
+            except FileNotFoundError:
+                matches = []
+
+            # prefer the current hash: the legacy directory may be stale
+            matches.sort(key=lambda path: not path.name.endswith(suffixes[0]))
+
+            if not matches:
                 #
                 # either the base state dir doesn't yet exist
                 # or it does but there are no collisions
                 #
                 # either way all good: let's initialize the new one
                 #
-                path_conf = path_state / 'conf'
-                path_conf.mkdir(parents=True)
-
-                for conf in self.conf:
-                    link_path = path_conf / conf.__path__.name
-                    link_path.symlink_to(conf.__path__)
+                if self._debug_state_conf_:
+                    path_conf = path_state / 'conf'
+                    path_conf.mkdir(parents=True)
+
+                    for conf in self.conf:
+                        link_path = path_conf / conf.__path__.name
+                        link_path.symlink_to(conf.__path__)
+                else:
+                    path_state.mkdir(parents=True)
             else:
                 # found one: migrate it
+                (collision, extras) = (matches[0], matches[1:])
+
                 self.logger.debug(
                     stale=str(collision),
                     msg='migrating stale state directory',
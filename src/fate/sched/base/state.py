@@ -19,6 +19,9 @@ class BoundTaskStateManager:
     def read(self):
         return self.manager.read(self.task)
 
+    def read_bytes(self):
+        return self.manager.read_bytes(self.task)
+
     def write(self, output):
         self.manager.write(self.task, output)
 
@@ -40,6 +43,7 @@ class TaskStateManager:
         self.db = CachedLmdbDict(state_path)
 
         self._l_cache_ = {}
+        self._e_cache_ = {}
         self._g_cache_ = {}
 
     @staticmethod
@@ -117,6 +121,20 @@ class TaskStateManager:
 
         return self._l_cache_[task.__name__]
 
+    def read_bytes(self, task):
+        """Retrieve task's state in its preferred serialization format,
+        encoded for transmission to the task.
+
+        As with `read`, the result is cached -- such that repeated
+        invocations of the task needn't each re-encode its state.
+
+        """
+        try:
+            return self._e_cache_[task.__name__]
+        except KeyError:
+            encoded = self._e_cache_[task.__name__] = self.read(task).encode()
+            return encoded
+
     def write(self, task, output):
         """Persist task's written output state.
 
@@ -129,6 +147,7 @@ class TaskStateManager:
 
         # update caches
         self._g_cache_.clear()
+        self._e_cache_.pop(task.__name__, None)
         self._l_cache_[task.__name__] = output
 
         # deserialize output
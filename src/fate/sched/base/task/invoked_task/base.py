@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import selectors
 import typing
 
 from .. import ext
@@ -18,6 +19,47 @@ class InvokedTask(ext.TaskConfExt):
     def ready_(self) -> bool:
         pass
 
+    # a single poll() (rather than a persistent epoll) suits a selector
+    # constructed anew for each check of a changing set of pipes
+    _Selector_ = getattr(selectors, 'PollSelector', selectors.SelectSelector)
+
     @abc.abstractmethod
-    def events_(self) -> typing.Optional[TaskEvents]:
+    def events_(self, ready=None) -> typing.Optional[TaskEvents]:
         pass
+
+    def poll_hint_(self) -> float:
+        """Seconds which may elapse before the task should next be
+        polled.
+
+        (By default, the task should be polled promptly.)
+
+        """
+        return 0.0
+
+    def _pipes_(self) -> typing.Iterator[typing.Tuple[typing.IO, int]]:
+        """Generate the task's open pipes to be checked for readiness
+        (for reading or writing) -- as pairs of file and event mask.
+
+        """
+        yield from ()
+
+    @classmethod
+    def select_(cls,
+                tasks: typing.Iterable[InvokedTask],
+                timeout=0) -> typing.FrozenSet[typing.IO]:
+        """Check the pipes of all given tasks for readiness at once,
+        and return the set of those which are ready for I/O.
+
+        The result may be passed on to each task's `events_`, such that
+        I/O is performed only where it may be fruitful.
+
+        """
+        with cls._Selector_() as selector:
+            for task in tasks:
+                for (file, events) in task._pipes_():
+                    selector.register(file, events)
+
+            if not selector.get_map():
+                return frozenset()
+
+            return frozenset(key.fileobj for (key, _events) in selector.select(timeout))
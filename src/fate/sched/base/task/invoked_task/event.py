@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import abc
+import collections
 import itertools
 import sys
 import typing
@@ -97,19 +98,27 @@ class TaskEvents:
 
     _events: typing.List[TaskEvent] = field(default_factory=list, init=False)
 
+    # events not yet read (in order) -- s.t. reads needn't rescan the history
+    _unread: typing.Deque[TaskEvent] = field(default_factory=collections.deque, init=False)
+
     def __post_init__(self, iterable) -> None:
-        self._events.extend(iterable)
+        self._extend_(iterable)
 
     def __iter__(self) -> typing.Iterator[TaskEvent]:
         yield from self._events
 
-    def _iter_unread_(self) -> typing.Iterator[TaskEvent]:
-        for event in self:
-            if not event.read:
-                yield event
+    def _extend_(self, events: typing.Iterable[TaskEvent]) -> None:
+        start = len(self._events)
+        self._events.extend(events)
+        self._unread.extend(event for event in itertools.islice(self._events, start, None)
+                            if not event.read)
+
+    def _pop_unread_(self) -> typing.Iterator[TaskEvent]:
+        while self._unread:
+            yield self._unread.popleft()
 
     def read(self, count=None) -> typing.Iterator[TaskEvent]:
-        for event in itertools.islice(self._iter_unread_(), count):
+        for event in itertools.islice(self._pop_unread_(), count):
             event.read = True
             yield event
 
@@ -117,7 +126,7 @@ class TaskEvents:
         if self.closed:
             raise ValueError("TaskEvents is closed")
 
-        self._events.extend(events)
+        self._extend_(events)
 
     def close(self) -> None:
         self.closed = True
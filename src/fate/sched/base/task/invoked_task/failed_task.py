@@ -24,5 +24,5 @@ class FailedInvocationTask(InvokedTask):
     def ready_(self) -> bool:
         return True
 
-    def events_(self) -> TaskEvents:
+    def events_(self, ready=None) -> TaskEvents:
         return self._events_
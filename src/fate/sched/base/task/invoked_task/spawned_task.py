@@ -2,11 +2,12 @@
 from __future__ import annotations
 
 import datetime
+import fcntl
+import functools
 import os
+import selectors
 import shutil
 import signal
-import subprocess
-import sys
 import time
 import typing
 
@@ -15,6 +16,8 @@ from descriptors import cachedproperty, classonlymethod
 from fate.common.log import LogReader
 from fate.common.output import CompletingTask
 from fate.util import stream
+from fate.util.compat.os import waitstatus_to_exitcode
+from fate.util.os import close_fds, inheritable_fds
 
 from .. import ext
 
@@ -49,9 +52,168 @@ class Pipe(typing.NamedTuple):
         return cls._make(os.pipe())
 
 
+# (available as of Python 3.13)
+_SPAWN_CLOSEFROM = hasattr(os, 'POSIX_SPAWN_CLOSEFROM')
+
+
+def _which(program, path):
+    """Resolve the executable for `program` on the given `path`.
+
+    Resolution requires as many as a syscall per directory on the path;
+    and, the same programs are executed time and again -- so results
+    are cached. However, a long-lived scheduler must not hold onto a
+    resolution indefinitely -- *e.g.* a program newly installed to a
+    directory earlier on the path should be picked up. As such, results
+    are cached for at most `_WHICH_TTL` seconds.
+
+    A path with relative directories -- resolved against the working
+    directory, (which the cache doesn't consider) -- is not cached.
+
+    See `_which_cached`.
+
+    """
+    if path is not None and not all(os.path.isabs(dir_) for dir_ in path.split(os.pathsep)):
+        return shutil.which(program, path=path)
+
+    return _which_cached(program, path, int(time.time() // _WHICH_TTL))
+
+
+# seconds for which executable resolutions are cached (at most)
+_WHICH_TTL = 60
+
+
+@functools.lru_cache(maxsize=256)
+def _which_cached(program, path, _epoch):
+    # (resolutions of earlier epochs are evicted in time by the LRU)
+    return shutil.which(program, path=path)
+
+
+class SpawnedProcess:
+    """Handle to a child process launched via `os.posix_spawn`.
+
+    This provides the subset of the interface of `subprocess.Popen`
+    required of task processes -- `pid`, `returncode`, `poll` and
+    `send_signal` -- as well as (unbuffered) files of the parent's ends
+    of the child's standard pipes.
+
+    Unlike `Popen` given a `preexec_fn`, the child's descriptors are
+    arranged by posix_spawn "file actions" rather than by Python code
+    executed in a forked child -- such that the platform's (vfork-based)
+    fast path may be used.
+
+    """
+    # signals ignored by the interpreter which the child should not inherit
+    # (as with Popen's restore_signals)
+    _restore_signals_ = tuple(getattr(signal, name) for name in ('SIGPIPE', 'SIGXFZ', 'SIGXFSZ')
+                              if hasattr(signal, name))
+
+    def __init__(self, pid, stdin, stdout, stderr):
+        self.pid = pid
+        self.pgid = pid  # (see: spawn)
+        self.stdin = stdin
+        self.stdout = stdout
+        self.stderr = stderr
+        self.returncode = None
+
+    # preferred capacity of the stdout pipe
+    _stdout_size_ = 1 << 20
+
+    @classonlymethod
+    def spawn(cls, path, args, *, fds=None):
+        """Launch the executable at `path` with the argument list
+        `args` (including its name) in a new process group.
+
+        The child's standard streams are connected to new pipes.
+        Additional descriptors to be inherited by the child may be
+        specified by the mapping `fds` of child descriptor to parent
+        descriptor. (Like the child's ends of its standard pipes, these
+        descriptors are closed in the parent process.) No other
+        descriptors are inherited by the child -- as with `Popen` given
+        `close_fds`.
+
+        """
+        # (ordered such that the child's ends -- to be closed together --
+        # are likely to be consecutive)
+        (stdout_r, stdout_w) = os.pipe()
+        (stdin_r, stdin_w) = os.pipe()
+        (stderr_r, stderr_w) = os.pipe()
+
+        if cls._stdout_size_ and hasattr(fcntl, 'F_SETPIPE_SZ'):
+            # enlarge stdout's pipe (where supported) s.t. large outputs
+            # are read in fewer (larger) chunks
+            try:
+                fcntl.fcntl(stdout_r, fcntl.F_SETPIPE_SZ, cls._stdout_size_)
+            except OSError:
+                pass
+
+        child_fds = {0: stdin_r, 1: stdout_w, 2: stderr_w}
+
+        if fds:
+            child_fds.update(fds)
+
+        # sources which are themselves targets would be overwritten by
+        # preceding actions: lift these out of the way
+        lifted = []
+
+        try:
+            file_actions = []
+
+            for (target, source) in child_fds.items():
+                if source in child_fds:
+                    source = fcntl.fcntl(source, fcntl.F_DUPFD_CLOEXEC, max(child_fds) + 1)
+                    lifted.append(source)
+
+                file_actions.append((os.POSIX_SPAWN_DUP2, source, target))
+
+            # as with Popen's close_fds: the child inherits only the above
+            if _SPAWN_CLOSEFROM and len(child_fds) == max(child_fds) + 1:
+                file_actions.append((os.POSIX_SPAWN_CLOSEFROM, len(child_fds)))
+            else:
+                file_actions.extend((os.POSIX_SPAWN_CLOSE, fd)
+                                    for fd in sorted(inheritable_fds()) if fd not in child_fds)
+
+            pid = os.posix_spawn(path, args, os.environ,
+                                 file_actions=file_actions,
+                                 setpgroup=0,
+                                 setsigdef=cls._restore_signals_)
+        except BaseException:
+            for parent_desc in (stdin_w, stdout_r, stderr_r):
+                os.close(parent_desc)
+
+            raise
+        finally:
+            # close child's descriptors in parent process
+            close_fds({*child_fds.values(), *lifted})
+
+        return cls(
+            pid,
+            stdin=open(stdin_w, 'wb', buffering=0),
+            stdout=open(stdout_r, 'rb', buffering=0),
+            stderr=open(stderr_r, 'rb', buffering=0),
+        )
+
+    def poll(self) -> typing.Optional[int]:
+        if self.returncode is None:
+            try:
+                (pid, status) = os.waitpid(self.pid, os.WNOHANG)
+            except ChildProcessError:
+                # reaped elsewhere: exit status unavailable (as with Popen)
+                self.returncode = 0
+            else:
+                if pid == self.pid:
+                    self.returncode = waitstatus_to_exitcode(status)
+
+        return self.returncode
+
+    def send_signal(self, sig) -> None:
+        # don't risk signaling a recycled pid
+        if self.poll() is None:
+            os.kill(self.pid, sig)
+
+
 class _TaskProcess(typing.NamedTuple):
 
-    process: subprocess.Popen
+    process: SpawnedProcess
     stdin: stream.BufferedInput
     statein: stream.BufferedInput
     stdout: stream.ProgressiveOutput
@@ -78,37 +240,6 @@ class SpawnedTask(ext.BoundTask, InvokedTask, CompletingTask):
 
     _stateout_ = cachedproperty.static(Pipe.open)
 
-    @staticmethod
-    def _dup_fd_(src, dst):
-        """Duplicate (copy) file descriptor `src` to `dst`.
-
-        `dst` *may not* be one of the standard file descriptors (0-2).
-        `dst` is not otherwise checked.
-
-        The duplicate descriptor is set inheritable.
-
-        It is presumed that this method is used in the context of a
-        process fork, *e.g.* as the `preexec_fn` of `subprocess.Popen`
-        -- and with `close_fds=True`. (As such, any file descriptor may
-        be available for use as `dst`.)
-
-        """
-        if src == dst:
-            return
-
-        if dst < 3:
-            raise ValueError(f"will not overwrite standard file descriptor: {dst}")
-
-        os.dup2(src, dst, inheritable=True)
-
-    def _set_fds_(self):
-        """Duplicate inherited state file descriptors to conventional
-        values in the task subprocess.
-
-        """
-        for (parent, child) in zip(self._state_parent_, reversed(self._state_child_)):
-            self._dup_fd_(parent, child)
-
     @property
     def _state_parent_(self):
         """The parent process's originals of its child's pair of
@@ -117,25 +248,18 @@ class SpawnedTask(ext.BoundTask, InvokedTask, CompletingTask):
         """
         return PipeRW(self._statein_.output, self._stateout_.input)
 
-    @property
-    def _pass_fds_(self):
-        """The child process's readable and writable state file
-        descriptors -- *both* the originals and their desired
-        conventional values.
-
-        These descriptors must be inherited by the child process -- and
-        not closed -- for inter-process communication of task state.
-
-        """
-        return self._state_parent_ + self._state_child_
+    #
+    # parent ends of state pipes are wrapped by unbuffered (raw) files:
+    # reads and writes are non-blocking and handled by our own buffers
+    #
 
     @cachedproperty
     def _stateinfile_(self) -> typing.BinaryIO:
-        return open(self._statein_.input, 'wb')
+        return open(self._statein_.input, 'wb', buffering=0)
 
     @cachedproperty
     def _stateoutfile_(self) -> typing.BinaryIO:
-        return open(self._stateout_.output, 'rb')
+        return open(self._stateout_.output, 'rb', buffering=0)
 
     @InvokedTask._constructor_
     def spawn(cls, task, state):
@@ -156,6 +280,7 @@ class SpawnedTask(ext.BoundTask, InvokedTask, CompletingTask):
         self._process_ = None
         self._started_ = None
         self._ended_ = None
+        self._active_ = None
 
         self.terminated_ = None
         self.killed_ = None
@@ -191,76 +316,53 @@ class SpawnedTask(ext.BoundTask, InvokedTask, CompletingTask):
         self._events_ = TaskEvents()
         self._log_reader = LogReader(self.stderr_)
 
-    def _preexec_legacy(self) -> None:
-        # Assign (duplicate) state file descriptors to expected values
-        self._set_fds_()
-
-        # Assign the child process its own new process group
-        os.setpgrp()
-
     def _popen(self) -> _TaskProcess:
         (program, *args) = self.exec_
 
-        executable = shutil.which(program)
+        executable = _which(program, os.environ.get('PATH'))
 
         if executable is None:
             raise TaskInvocationError(f'command not found on path: {program}')
 
-        # We prefer to have Popen handle child setup as much as possible
-        # so we opt into new features as they become available.
-        if sys.version_info < (3, 11):
-            # Popen doesn't yet offer process_group so we'll do it ourselves
-            kwargs = dict(
-                preexec_fn=self._preexec_legacy,
-            )
-        else:
-            # We can just use process_group
-            kwargs = dict(
-                # Assign the child process its own new process group
-                process_group=0,
-
-                preexec_fn=self._set_fds_,
-            )
-
-        process = subprocess.Popen(
-            [executable] + args,
-            stdin=subprocess.PIPE,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            pass_fds=self._pass_fds_,
-            **kwargs,
-        )
+        # provide state pipes at their conventional descriptors
+        state_fds = dict(zip(reversed(self._state_child_), self._state_parent_))
+
+        try:
+            process = SpawnedProcess.spawn(executable, [executable, *args], fds=state_fds)
+        except FileNotFoundError as exc:
+            # executable resolution is cached -- and that executable has since been removed:
+            # fail this invocation (as if unresolved) and resolve anew upon the next
+            _which_cached.cache_clear()
+
+            # (spawn has closed the child's ends of the state pipes -- close the parent's)
+            close_fds((self._statein_.input, self._stateout_.output))
+
+            raise TaskInvocationError(f'command not found on path: {program}') from exc
 
         result = _TaskProcess(
             process=process,
 
             # stdout needn't be inspected until the task completes; and, synchronous, non-blocking
             # processing of the pipe is relatively inefficient (for large payloads). instead,
-            # we'll launch a daemon thread to sit on it and read it as efficiently as possible.
-            stdout=stream.progressive_output(process.stdout,
-                                             f'Reader ({self.__name__} {process.pid}): stdout'),
+            # we'll register it with a daemon thread which reads all tasks' stdout as efficiently
+            # as possible (as data arrives).
+            stdout=stream.progressive_output(process.stdout),
 
             # we don't expect any other IPC data to be huge; and, at least in the case of
             # stderr, we want to inspect it as it comes in.
             #
             # for simplicity: make pipe descriptors non-blocking & initialize buffer handlers
-            #
-            # (note: this works for pipes on Win32 but only as of Py312)
             stderr=stream.nonblocking_output(process.stderr),
             stateout=stream.nonblocking_output(self._stateoutfile_),
 
             stdin=stream.nonblocking_input(process.stdin, self.param_.encode()),
-            statein=stream.nonblocking_input(self._stateinfile_, self._state_.read().encode()),
+            statein=stream.nonblocking_input(self._stateinfile_, self._state_.read_bytes()),
         )
 
         # write inputs (at least up to buffer size)
         result.stdin.send()
         result.statein.send()
 
-        # close child's descriptors in parent process
-        for parent_desc in self._state_parent_:
-            os.close(parent_desc)
-
         return result
 
     def started_(self) -> typing.Optional[float]:
@@ -292,10 +394,11 @@ class SpawnedTask(ext.BoundTask, InvokedTask, CompletingTask):
         if self._process_ is None:
             raise ValueError("task not spawned")
 
-        if os.getpgid(self._process_.pid) == self._process_.pid:
-            # as expected: signal group
-            os.killpg(self._process_.pid, signal)
-        else:
+        # the process was spawned as leader of its own group: signal group
+        # (without first querying the group -- a system call per signal)
+        try:
+            os.killpg(self._process_.pgid, signal)
+        except ProcessLookupError:
             # unexpected: stick to process itself
             self._process_.send_signal(signal)
 
@@ -307,12 +410,61 @@ class SpawnedTask(ext.BoundTask, InvokedTask, CompletingTask):
         self._signal(signal.SIGKILL)
         self.killed_ = time.time()
 
-    def events_(self) -> typing.Optional[TaskEvents]:
+    def events_(self, ready=None) -> typing.Optional[TaskEvents]:
         if self._events_ is not None and not self._events_.closed:
-            self.poll_()
+            self.poll_(ready)
 
         return self._events_
 
+    def _pipes_(self) -> typing.Iterator[typing.Tuple[typing.IO, int]]:
+        if self._process_ is None:
+            return
+
+        for input_ in (self.stdin_, self.statein_):
+            if not input_.finished:
+                yield (input_.file, selectors.EVENT_WRITE)
+
+        for output in (self.stderr_, self.stateout_):
+            if not output.file.closed:
+                yield (output.file, selectors.EVENT_READ)
+
+    def _communicate_(self, ready=None) -> None:
+        active = False
+
+        for input_ in (self.stdin_, self.statein_):
+            if ready is None or input_.file in ready:
+                input_.send()
+                active = True
+
+        for output in (self.stderr_, self.stateout_):
+            if ready is None or output.file in ready:
+                output.receive(ready=ready is not None)
+                active = True
+
+        if active and ready is not None:
+            self._active_ = time.time()
+
+    def poll_hint_(self) -> float:
+        """Seconds which may elapse before the task should next be
+        polled.
+
+        The longer the task's pipes have been inactive, the less
+        frequently it need be polled -- (half the time since it was
+        last active) -- though not past its expiry.
+
+        """
+        if self._started_ is None or self._ended_ is not None:
+            return 0.0
+
+        now = time.time()
+
+        hint = (now - (self._active_ or self._started_)) / 2
+
+        if (expires := self.expires_()) is not None:
+            hint = min(hint, expires - now)
+
+        return max(hint, 0.0)
+
     def _record_events_(self, returncode: typing.Optional[int]) -> None:
         if self._events_ is None:
             raise ValueError("task not spawned")
@@ -329,7 +481,7 @@ class SpawnedTask(ext.BoundTask, InvokedTask, CompletingTask):
             self._events_.write(TaskReadyEvent(self, returncode))
             self._events_.close()
 
-    def poll_(self) -> typing.Optional[int]:
+    def poll_(self, ready=None) -> typing.Optional[int]:
         """Check whether the task program has exited and return its exit
         code if any.
 
@@ -338,7 +490,10 @@ class SpawnedTask(ext.BoundTask, InvokedTask, CompletingTask):
         continued past this, the KILL signal is sent.
 
         BufferedInput and BufferedOutput handlers are invoked to send/
-        receive remaining data.
+        receive remaining data. If given the set of pipes known to be
+        `ready` -- see `select_` -- handlers of pipes not in this set
+        are skipped. (Once the process has exited, all pipes are
+        drained regardless.)
 
         Sets the SpawnedTask's `ended` time, and records the task's
         state output, when the process has terminated.
@@ -352,16 +507,16 @@ class SpawnedTask(ext.BoundTask, InvokedTask, CompletingTask):
 
         returncode = self._process_.poll()
 
-        self.stdin_.send()
-        self.statein_.send()
-
-        self.stderr_.receive()
-        self.stateout_.receive()
+        self._communicate_(ready if returncode is None else None)
 
         if returncode is not None and self._ended_ is None:
             self._ended_ = time.time()
 
+            # release descriptors of drained outputs immediately (for reuse
+            # by subsequent spawns) rather than upon garbage collection
             self.stdout_.close()
+            self.stderr_.close()
+            self.stateout_.close()
 
             # Note: with retry this will also permit 42
             if returncode == 0:
@@ -41,30 +41,34 @@ class SchedulerTiming:
             stat_result = os.stat(self.path_check)
         except FileNotFoundError:
             last_check = None
+
+            if update:
+                # create the file only where it's missing -- (in the usual case,
+                # the update is a stat and a utime)
+                os.close(os.open(self.path_check, os.O_WRONLY | os.O_CREAT, 0o644))
         else:
             last_check = stat_result.st_mtime
 
         if update:
-            if not self.path_check.exists():
-                self.path_check.touch()
-
+            # (setting explicit times requires ownership but not write permission)
             os.utime(self.path_check, (self.time_check, self.time_check))
 
         return last_check
 
     @cachedproperty
     def _next_check_tasks_(self):
-        next_check = None
-
-        for task in self.conf.task.values():
-            next_check = task.schedule_next_(
+        next_checks = (
+            task.schedule_next_(
                 self.time_check,             # t0
-                next_check,                  # t1
-                next_check,                  # default
+                None,                        # t1
+                None,                        # default
                 max_years_between_matches=1  # quit if it's that far out
             )
+            for task in self.conf.task.values()
+        )
 
-        return next_check
+        return min((next_check for next_check in next_checks if next_check is not None),
+                   default=None)
 
     _next_max_ = 60 * 60 * 24 * 365  # 1 year in seconds
 
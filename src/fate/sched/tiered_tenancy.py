@@ -43,9 +43,12 @@ class TieredTenancyScheduler(TaskScheduler):
 
     """
     # Note: optimum time to wait before polling unclear.
-    # For now, let's just wait a "slice":
+    # For now, let's wait at least a "slice":
     poll_frequency = get_interval()
 
+    # ...and at most a few (while tasks' pipes are quiet):
+    poll_frequency_max = 4 * poll_frequency
+
     def exec_tasks(self, reset=False):
         count_completed = 0
 
@@ -68,7 +71,7 @@ class TieredTenancyScheduler(TaskScheduler):
                     pool.expand(queue.tenancy_tasks(min_tenancy), size=min_tenancy)
                     self.logger.debug(tenancy=pool.size, active=pool.count, msg='expanded pool')
 
-                if time.time() >= self.timing.next_check:
+                if (now := time.time()) >= self.timing.next_check:
                     tasks_1 = self.collect_tasks(reset=True)
                     queue.append(tasks_1)
 
@@ -80,7 +83,12 @@ class TieredTenancyScheduler(TaskScheduler):
                     if count_fill:
                         self.logger.debug(active=pool.count, msg='filled pool')
 
-                time.sleep(self.poll_frequency)
+                # back off polling of quiet tasks (though not past the next check)
+                poll_wait = min(max(pool.poll_hint(), self.poll_frequency),
+                                self.poll_frequency_max,
+                                self.timing.next_check - now)
+
+                time.sleep(max(poll_wait, 0))
 
                 (count_ready,
                  count_events) = yield from pool.iter_events(refill=queue.tenancy_tasks(pool.size))
@@ -4,6 +4,7 @@ import functools
 import operator
 import os
 import pathlib
+import stat
 
 
 class ChoiceMapping(argparse.Action):
@@ -20,13 +21,28 @@ class ChoiceMapping(argparse.Action):
         setattr(namespace, self.dest, self.mapping[value])
 
 
-def access_parent(path):
+def stat_parent(path):
+    """Find the nearest extant path among `path` and its ancestors.
+
+    Returns the path found together with the result of its `stat()`
+    (or `None` if not even the root could be stat'd).
+
+    """
     access_target = path
 
-    # Path.exists() calls stat() which can raise PermissionError (prematurely)
-    while not os.path.exists(access_target) and access_target.name != '':
+    while True:
+        try:
+            return (access_target, os.stat(access_target))
+        except OSError:
+            # (PermissionError may be raised prematurely -- keep climbing)
+            if access_target.name == '':
+                return (access_target, None)
+
         access_target = access_target.parent
 
+
+def access_parent(path):
+    (access_target, _stat_result) = stat_parent(path)
     return access_target
 
 
@@ -75,49 +91,61 @@ class PathAccess:
 
         self.parents = parents
 
+    @staticmethod
+    def _stat_(path):
+        try:
+            return os.stat(path)
+        except OSError:
+            return None
+
     def __call__(self, value):
         path = pathlib.Path(value)
 
-        access_target = access_parent(path) if self.parents else path
+        (access_target, stat_result) = (stat_parent(path) if self.parents
+                                        else (path, self._stat_(path)))
 
         if not self.access.ok(access_target):
             raise self.PathAccessError("failed to access path with mode "
                                        f"{self.access.mode}: {path}")
 
+        self.check_type(path, access_target, stat_result)
+
         return path
 
+    def check_type(self, path, access_target, stat_result):
+        """Check the type of the path (or of its nearest extant parent)
+        via the result of its `stat()`.
+
+        """
+
 
 class PathTypeError(argparse.ArgumentTypeError):
     """Subclass of ArgumentTypeError raised for path of incorrect type."""
 
 
-class FileAccess(PathAccess):
+class TypedPathAccess(PathAccess):
+    """PathAccess additionally ensuring the type of the path argument
+    (or of its nearest extant parent).
 
+    """
     PathTypeError = PathTypeError
 
-    def __call__(self, value):
-        path = super().__call__(value)
-
-        if self.parents and not path.exists():
-            if not access_parent(path).is_dir():
+    def check_type(self, path, access_target, stat_result):
+        if access_target != path:
+            # path does not exist (and self.parents)
+            if stat_result is None or not stat.S_ISDIR(stat_result.st_mode):
                 raise self.PathTypeError(f"path inaccessible: {path}")
-        elif not path.is_file():
-            raise self.PathTypeError(f"path must be file: {path}")
-
-        return path
+        elif stat_result is None or not self.path_type_test(stat_result.st_mode):
+            raise self.PathTypeError(f"path must be {self.path_type}: {path}")
 
 
-class DirAccess(PathAccess):
+class FileAccess(TypedPathAccess):
 
-    PathTypeError = PathTypeError
+    path_type = 'file'
+    path_type_test = staticmethod(stat.S_ISREG)
 
-    def __call__(self, value):
-        path = super().__call__(value)
 
-        if self.parents and not path.exists():
-            if not access_parent(path).is_dir():
-                raise self.PathTypeError(f"path inaccessible: {path}")
-        elif not path.is_dir():
-            raise self.PathTypeError(f"path must be directory: {path}")
+class DirAccess(TypedPathAccess):
 
-        return path
+    path_type = 'directory'
+    path_type_test = staticmethod(stat.S_ISDIR)
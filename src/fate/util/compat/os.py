@@ -24,3 +24,14 @@ def get_interval(default=COMPAT_INTERVAL):
         return default
     else:
         return sched_rr_get_interval(0) or default
+
+
+def waitstatus_to_exitcode(status):
+    try:
+        return os.waitstatus_to_exitcode(status)
+    except AttributeError:
+        # Python < 3.9
+        if os.WIFSIGNALED(status):
+            return -os.WTERMSIG(status)
+
+        return os.WEXITSTATUS(status)
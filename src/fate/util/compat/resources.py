@@ -25,4 +25,9 @@ def __dir__():
 
 
 def __getattr__(name):
-    return getattr(_target_, name)
+    value = getattr(_target_, name)
+
+    # cache on this module so subsequent look-ups needn't be delegated
+    globals()[name] = value
+
+    return value
@@ -1,6 +1,8 @@
 import enum
 import functools
 
+from descriptors import cachedclassproperty
+
 
 class MixedEnumMeta(enum.EnumMeta):
 
@@ -82,6 +84,10 @@ class FileFormatEnum(enum.Enum):
     def suffix(self):
         return f'.{self.name}'
 
+    @cachedclassproperty
+    def suffixes(cls):
+        return tuple(member.suffix for member in cls)
+
 
 def _make(cls, iterable):
     candidates = (getattr(base, '_make', None) for base in cls.mro()
@@ -13,10 +13,25 @@ class LazyLoadMap(abc.ABC):
 
     To customize how the mapping is updated, override `__setdata__`.
 
+    Instances are constructed as an "unloaded" variant of their class,
+    which guards look-up methods with loading. Upon loading, instances
+    are reassigned their proper class, such that subsequent look-ups
+    incur no such overhead.
+
     """
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self._loaded_ = False
+    _loaded_ = True
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        if not issubclass(cls, _UnloadedMap):
+            cls.__unloaded__ = type(cls)(cls.__name__, (_UnloadedMap, cls), {
+                '__module__': cls.__module__,
+                '__qualname__': cls.__qualname__,
+            })
+
+    def __new__(cls, *args, **kwargs):
+        return super().__new__(cls.__unloaded__)
 
     @abc.abstractmethod
     def __getdata__(self):
@@ -28,27 +43,37 @@ class LazyLoadMap(abc.ABC):
     def _load_(self):
         data = self.__getdata__()
         self.__setdata__(data)
-        self._loaded_ = True
+        self.__class__ = self.__class__.__loaded__
+
+
+class _UnloadedMap:
+    """Mix-in of a LazyLoadMap which has yet to load its data.
+
+    Look-up methods load data before delegating to those of the
+    LazyLoadMap's proper class.
+
+    """
+    _loaded_ = False
 
-    def _loadif_(self):
-        if not self._loaded_:
-            self._load_()
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        (_unloaded, cls.__loaded__) = cls.__bases__
 
     def __getitem__(self, key):
-        self._loadif_()
-        return super().__getitem__(key)
+        self._load_()
+        return self[key]
 
     def __repr__(self):
-        self._loadif_()
-        return super().__repr__()
+        self._load_()
+        return repr(self)
 
     def __iter__(self):
-        self._loadif_()
-        return super().__iter__()
+        self._load_()
+        return iter(self)
 
     def __len__(self):
-        self._loadif_()
-        return super().__len__()
+        self._load_()
+        return len(self)
 
 
 class LazyLoadProxyMapping(LazyLoadMap, ProxyMapping):
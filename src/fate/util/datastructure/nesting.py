@@ -57,7 +57,10 @@ class NestingConf:
     def __getitem__(self, key):
         value = super().__getitem__(key)
 
-        if isinstance(value, NestedConf):
+        if isinstance(value, NestedConf) and (
+            # values already adopted under this key needn't be again
+            value.__parent__ is not self or value.__name__ != key
+        ):
             try:
                 self.__adopt__(key, value)
             except self.ReadoptionError:
@@ -222,7 +225,9 @@ class at_depth:
 
 class DecoratedNestedConf(NestedConf):
 
-    __atdepth_members__ = ()
+    __atdepth_members__ = frozenset()
+
+    __atdepth_descriptors__ = ()
 
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
@@ -245,12 +250,16 @@ class DecoratedNestedConf(NestedConf):
             if isinstance(obj, at_depth)
         )
 
-        cls.__atdepth_members__ = tuple(atdepth_members)
+        cls.__atdepth_members__ = frozenset(atdepth_members)
+
+        # retrieve descriptors once rather than upon each instance's dir()
+        cls.__atdepth_descriptors__ = tuple((name, getattr(cls, name))
+                                            for name in atdepth_members)
 
     @cachedproperty
     def __atdepth_hidden__(self):
-        return frozenset(name for name in self.__atdepth_members__
-                         if not getattr(self.__class__, name).__present__(self))
+        return frozenset(name for (name, descriptor) in self.__atdepth_descriptors__
+                         if not descriptor.__present__(self))
 
     def __dir__(self):
         # let's try just excluding those defined here
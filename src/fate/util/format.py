@@ -1,69 +1,166 @@
 """Configurable support for serialization formats."""
-import bz2
 import collections
-import csv
-import gzip
+import copy
 import io
 import json
-import lzma
-import tarfile
+import functools
+import re
+import types
 import typing
-from functools import partial
 
-import toml
-import yaml
 from descriptors import classproperty
 
+if typing.TYPE_CHECKING:
+    import tarfile
+
 from fate.util.datastructure import CallableEnum, FileFormatEnum
 
 
-class ConfigurableYamlLoader(yaml.SafeLoader):
-    """YAML SafeLoader supporting alternate collection classes.
+@functools.lru_cache(maxsize=None)
+def get_yaml_loader():
+    """Construct the YAML loader class -- (importing `yaml` only upon
+    first call).
+
+    """
+    import yaml
+
+    # prefer bindings to libyaml (where installed)
+    SafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+    class ConfigurableYamlLoader(SafeLoader):
+        """YAML SafeLoader supporting alternate collection classes.
+
+        Mapping objects default to the built-in `dict`. Sequences to the
+        built-in `list`. Alternate constructors may be specified upon
+        initialization of the loader.
+
+        Note: To use with the default interface, `yaml.load()`, a
+        `partial` must be constructed, for example:
+
+            yaml.load(stream, functools.partial(ConfigurableYamlLoader,
+                                                dict_=NewDict))
+
+        """
+        def __init__(self, stream, dict_=None, list_=None):
+            super().__init__(stream)
+            self.dict_ = dict_
+            self.list_ = list_
+
+        def construct_yaml_seq(self, node):
+            data = [] if self.list_ is None else self.list_()
+            yield data
+            data.extend(self.construct_sequence(node))
+
+        def construct_yaml_map(self, node):
+            data = {} if self.dict_ is None else self.dict_()
+            yield data
+
+            if not isinstance(node, yaml.MappingNode):
+                raise yaml.constructor.ConstructorError(
+                    None, None, f"expected a mapping node, but found {node.id}", node.start_mark
+                )
+
+            # construct items directly into data (rather than into an intermediary)
+            self.flatten_mapping(node)
+
+            for (key_node, value_node) in node.value:
+                key = self.construct_object(key_node)
+
+                if not isinstance(key, collections.abc.Hashable):
+                    raise yaml.constructor.ConstructorError(
+                        "while constructing a mapping", node.start_mark,
+                        "found unhashable key", key_node.start_mark,
+                    )
+
+                data[key] = self.construct_object(value_node)
+
+    ConfigurableYamlLoader.add_constructor('tag:yaml.org,2002:seq',
+                                           ConfigurableYamlLoader.construct_yaml_seq)
+
+    ConfigurableYamlLoader.add_constructor('tag:yaml.org,2002:map',
+                                           ConfigurableYamlLoader.construct_yaml_map)
+
+    return ConfigurableYamlLoader
+
 
-    Mapping objects default to the built-in `dict`. Sequences to the
-    built-in `list`. Alternate constructors may be specified upon
-    initialization of the loader.
+@functools.lru_cache(maxsize=None)
+def get_toml_decoder():
+    """Construct the TOML decoder class -- (importing `toml` only upon
+    first call).
 
-    Note: To use with the default interface, `yaml.load()`, a `partial`
-    must be constructed, for example:
+    """
+    import toml
+
+    class ConfigurableTomlDecoder(toml.TomlDecoder):
+
+        def __init__(self, _dict=dict, _list=list):
+            super().__init__(_dict=_dict)
+            self._list = _list
+
+        def load_array(self, a):
+            result = super().load_array(a)
+            return result if type(result) == self._list else self._list(result)
+
+    return ConfigurableTomlDecoder
 
-        yaml.load(stream, functools.partial(ConfigurableYamlLoader,
-                                            dict_=NewDict))
+
+def retype(obj, dict_=None, list_=None, leaf=None):
+    """Reconstruct the dicts and lists nested in `obj` as the given
+    collection types.
+
+    Any other objects nested in `obj` are passed through `leaf`, (if
+    given).
 
     """
-    def __init__(self, stream, dict_=None, list_=None):
-        super().__init__(stream)
-        self.dict_ = dict_
-        self.list_ = list_
+    if isinstance(obj, dict):
+        items = ((key, retype(value, dict_, list_, leaf)) for (key, value) in obj.items())
+        return dict(items) if dict_ is None else dict_(items)
+
+    if isinstance(obj, list):
+        values = [retype(value, dict_, list_, leaf) for value in obj]
+        return values if list_ is None else list_(values)
+
+    return obj if leaf is None else leaf(obj)
+
 
-    def construct_yaml_seq(self, node):
-        data = [] if self.list_ is None else self.list_()
-        yield data
-        data.extend(self.construct_sequence(node))
+@functools.lru_cache(maxsize=None)
+def get_orjson():
+    """Import the optional accelerator `orjson` upon first call (or
+    return `None` where it is not installed).
+
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    else:
+        return orjson
 
-    def construct_yaml_map(self, node):
-        data = {} if self.dict_ is None else self.dict_()
-        yield data
-        value = self.construct_mapping(node)
-        data.update(value)
 
+def csv_error():
+    import csv
+    return csv.Error
 
-ConfigurableYamlLoader.add_constructor('tag:yaml.org,2002:seq',
-                                       ConfigurableYamlLoader.construct_yaml_seq)
 
-ConfigurableYamlLoader.add_constructor('tag:yaml.org,2002:map',
-                                       ConfigurableYamlLoader.construct_yaml_map)
+def tar_error():
+    import tarfile
+    return tarfile.TarError
 
 
-class ConfigurableTomlDecoder(toml.TomlDecoder):
+def toml_error():
+    try:
+        import tomllib
+    except ImportError:
+        # Python < 3.11
+        import toml
+        return toml.decoder.TomlDecodeError
+    else:
+        return tomllib.TOMLDecodeError
 
-    def __init__(self, _dict=dict, _list=list):
-        super().__init__(_dict=_dict)
-        self._list = _list
 
-    def load_array(self, a):
-        result = super().load_array(a)
-        return result if type(result) == self._list else self._list(result)
+def yaml_error():
+    import yaml
+    return yaml.error.YAMLError
 
 
 class JSONEncoder(json.JSONEncoder):
@@ -79,7 +176,9 @@ class JSONEncoder(json.JSONEncoder):
         # let base class raise TypeError
         return super().default(obj)
 
-json_encoder = JSONEncoder()
+# serialized objects are decoded data or plain task output -- not
+# self-referential -- and needn't be tracked for circular references
+json_encoder = JSONEncoder(check_circular=False)
 
 
 class tag:
@@ -109,6 +208,70 @@ auto = tag('auto', True)
 
 binary = tag('binary', True)
 
+sniff = tag('sniff')
+
+
+# leading characters of any document accepted by json.loads
+# (including the non-standard NaN and Infinity)
+JSON_LEADS = frozenset('{["-0123456789tfnNI')
+
+JSON_WHITESPACE = ' \t\n\r'
+
+# run of digits beyond which orjson may not decode an integer exactly
+# (integers exceeding 64 bits are decoded as floats)
+JSON_LONG_DIGITS = re.compile(r'\d{20}')
+
+
+def sniff_json(text):
+    return text.lstrip(JSON_WHITESPACE)[:1] in JSON_LEADS
+
+
+def sniff_toml(text):
+    # any key-value pair requires "=" and any table "[" -- a document without
+    # these may consist only of whitespace and comments
+    return ('=' in text or '[' in text
+            or all(line.lstrip().startswith('#') for line in text.splitlines() if line.strip()))
+
+
+# size of a tar header (tarfile.BLOCKSIZE)
+TAR_BLOCKSIZE = 512
+
+
+# magic numbers of the compressions which tarfile may detect
+TAR_COMPRESSION_MAGIC = (
+    b'\x1f\x8b',         # gzip
+    b'BZh',              # bz2
+    b'\xfd7zXZ',         # xz
+    b']',                # lzma (legacy)
+    b'(\xb5/\xfd',       # zstd
+)
+
+
+def tar_checksum(header):
+    """Whether the given header block bears a valid tar checksum."""
+    try:
+        checksum = int(header[148:156].split(b'\0', 1)[0].strip() or b'0', 8)
+    except ValueError:
+        return False
+
+    # checksum is the sum of the header's bytes (with its own field as spaces)
+    return checksum == 256 + sum(header[:148]) + sum(header[156:512])
+
+
+def sniff_tar(binary):
+    if binary.startswith(TAR_COMPRESSION_MAGIC):
+        return True
+
+    # an uncompressed archive is at least one header block, which (unless
+    # pre-POSIX) bears the ustar magic -- and, regardless, a valid checksum
+    # -- or, for an empty archive, is the zeroed end-of-archive block
+    if len(binary) < TAR_BLOCKSIZE:
+        return False
+
+    header = binary[:TAR_BLOCKSIZE]
+
+    return header[257:262] == b'ustar' or tar_checksum(header) or not header.strip(b'\0')
+
 
 class _NameList:
 
@@ -121,7 +284,10 @@ class _Raises:
 
     @property
     def raises(self):
-        return getattr(self.value, 'raises', ())
+        raises = getattr(self.value, 'raises', ())
+
+        # exception classes of lazily-imported modules are given by function
+        return raises() if isinstance(raises, types.FunctionType) else raises
 
 
 class Decoder(typing.NamedTuple):
@@ -141,22 +307,49 @@ class Decoding(typing.NamedTuple):
     decoder: Decoder
 
 
-def taropen(binary: bytes) -> tarfile.TarFile:
-    return tarfile.open(fileobj=io.BytesIO(binary))
+def taropen(binary: bytes, seekable: bool = True) -> 'tarfile.TarFile':
+    """Open the archive encoded in `binary`.
+
+    Unless `seekable`, the archive is opened as a stream: its
+    compression is determined by its magic number, (rather than by
+    attempting each decompressor in turn); and, its members may only be
+    iterated, once.
+
+    """
+    import tarfile
+    return tarfile.open(fileobj=io.BytesIO(binary), mode='r:*' if seekable else 'r|*')
+
+
+# suffixes of the stream compressions recognized by tarfile
+TAR_STREAM_SUFFIXES = {
+    'gz': '.tar.gz',
+    'bz2': '.tar.bz2',
+    'xz': '.tar.xz',
+}
 
 
 class SLoader(_NameList, _Raises, FileFormatEnum, CallableEnum):
 
     @CallableEnum.member
-    @raises(csv.Error)
+    @raises(csv_error)
     def csv(text):
-        return list(csv.reader(text.splitlines()))
+        import csv
+        return list(csv.reader(io.StringIO(text)))
 
     @CallableEnum.member
     @auto
+    @sniff(sniff_json)
     @raises(json.decoder.JSONDecodeError)
     def json(text, dict_=None):
         if dict_ is None:
+            if (orjson := get_orjson()) is not None and not JSON_LONG_DIGITS.search(text):
+                try:
+                    return orjson.loads(text)
+                except orjson.JSONDecodeError:
+                    # orjson is strict -- defer to json for its extensions
+                    # (*e.g.* NaN) and for its error
+                    pass
+
             return json.loads(text)
 
         return json.loads(text, object_hook=dict_)
@@ -164,18 +357,13 @@ class SLoader(_NameList, _Raises, FileFormatEnum, CallableEnum):
     @CallableEnum.membermethod
     @auto
     @binary
-    @raises(tarfile.TarError)
+    @sniff(sniff_tar)
+    @raises(tar_error)
     def tar(self, binary):
-        archive = taropen(binary)
-
-        if isinstance(archive.fileobj, gzip.GzipFile):
-            suffix = '.tar.gz'
-        elif isinstance(archive.fileobj, bz2.BZ2File):
-            suffix = '.tar.bz2'
-        elif isinstance(archive.fileobj, lzma.LZMAFile):
-            suffix = '.tar.xz'
-        else:
-            suffix = self.suffix
+        # archive need only be read far enough to be recognized
+        archive = taropen(binary, seekable=False)
+
+        suffix = TAR_STREAM_SUFFIXES.get(archive.fileobj.comptype, self.suffix)
 
         decoder = self.decoder._replace(loader=taropen, suffix=suffix)
 
@@ -183,17 +371,28 @@ class SLoader(_NameList, _Raises, FileFormatEnum, CallableEnum):
 
     @CallableEnum.member
     @auto
-    @raises(toml.decoder.TomlDecodeError)
+    @sniff(sniff_toml)
+    @raises(toml_error)
     def toml(text, **types):
-        switched = {f'_{name}'.rstrip('_'): value for (name, value) in types.items()}
-        decoder = ConfigurableTomlDecoder(**switched)
-        return toml.loads(text, decoder=decoder)
+        try:
+            import tomllib
+        except ImportError:
+            # Python < 3.11
+            import toml
+
+            switched = {f'_{name}'.rstrip('_'): value for (name, value) in types.items()}
+            decoder = get_toml_decoder()(**switched)
+            return toml.loads(text, decoder=decoder)
+
+        return retype(tomllib.loads(text), **types)
 
     @CallableEnum.member
     @auto
-    @raises(yaml.error.YAMLError)
+    @raises(yaml_error)
     def yaml(text, **types):
-        conf = yaml.load(text, partial(ConfigurableYamlLoader, **types))
+        import yaml
+
+        conf = yaml.load(text, functools.partial(get_yaml_loader(), **types))
         return {} if conf is None else conf
 
     @classproperty
@@ -218,6 +417,17 @@ class SLoader(_NameList, _Raises, FileFormatEnum, CallableEnum):
     def binary(self):
         return getattr(self.value, 'binary', False)
 
+    def admits(self, content):
+        """Whether the given content *might* be decoded by this loader.
+
+        Loaders may be tagged with a cheap test of their input, (*e.g.*
+        its first character), such that content which certainly cannot
+        be decoded needn't be (expensively) attempted.
+
+        """
+        test = getattr(self.value, 'sniff', None)
+        return test is None or test(content)
+
     @property
     def decoder(self):
         return self.Decoder(loader=self, binary=self.binary,
@@ -250,7 +460,7 @@ class SLoader(_NameList, _Raises, FileFormatEnum, CallableEnum):
             for loader in cls.__auto__:
                 encoded = binary if loader.binary else text
 
-                if encoded is None:
+                if encoded is None or not loader.admits(encoded):
                     continue
 
                 try:
@@ -282,19 +492,42 @@ SLoader.Decoding = Decoding
 SLoader.Decoder = Decoder
 
 
+@functools.lru_cache(maxsize=64)
+def _load_text(sloader, text):
+    return sloader(text)
+
+
+def load_file(sloader, path, mode='r', **types):
+    """Load the file at `path` via the given `SLoader`.
+
+    Files are parsed only once for as long as their contents are
+    unchanged; each call receives its own copy of the result,
+    constructed of the given collection `types`.
+
+    """
+    with open(path, mode) as fd:
+        text = fd.read()
+
+    # the cache is keyed by contents (rather than by stat, which may not
+    # reflect a rewrite within the file system's timestamp resolution):
+    # reading is cheap next to parsing
+    data = _load_text(sloader, text)
+
+    # the parse is shared: copy any mutable leaves (e.g. YAML sets) as well
+    return retype(data, leaf=copy.deepcopy, **types)
+
+
 class Loader(_Raises, FileFormatEnum, CallableEnum):
 
     @CallableEnum.member
-    @raises(toml.decoder.TomlDecodeError)
+    @raises(toml_error)
     def toml(path, **types):
-        with open(path) as fd:
-            return SLoader.toml(fd.read(), **types)
+        return load_file(SLoader.toml, path, **types)
 
     @CallableEnum.member
-    @raises(yaml.error.YAMLError)
+    @raises(yaml_error)
     def yaml(path, **types):
-        with open(path) as fd:
-            return SLoader.yaml(fd, **types)
+        return load_file(SLoader.yaml, path, 'rb', **types)
 
 
 class Dumper(_NameList, CallableEnum):
@@ -305,8 +538,12 @@ class Dumper(_NameList, CallableEnum):
 
     @CallableEnum.member
     def toml(obj):
+        import toml
         return toml.dumps(obj)
 
     @CallableEnum.member
     def yaml(obj):
-        return yaml.dump(obj)
+        import yaml
+
+        # prefer bindings to libyaml (where installed)
+        return yaml.dump(obj, Dumper=getattr(yaml, 'CDumper', yaml.Dumper))
@@ -50,3 +50,73 @@ def system_path(path):
 
     if sys.platform == 'darwin':
         return not is_relative_to(path, '/Users')
+
+
+#
+# close_fds: close descriptors in as few system calls as possible
+#
+
+def close_fds(fds):
+    """Close the given file descriptors.
+
+    Runs of consecutive descriptors are closed together via
+    `os.closerange` -- (which may be implemented by the single system
+    call `close_range`).
+
+    """
+    run_start = run_stop = None
+
+    for fd in sorted(fds):
+        if fd == run_stop:
+            run_stop += 1
+            continue
+
+        if run_start is not None:
+            _close_run(run_start, run_stop)
+
+        (run_start, run_stop) = (fd, fd + 1)
+
+    if run_start is not None:
+        _close_run(run_start, run_stop)
+
+
+def _close_run(start, stop):
+    if stop - start == 1:
+        os.close(start)
+    else:
+        os.closerange(start, stop)
+
+
+#
+# inheritable_fds: descriptors which would survive exec
+#
+
+def inheritable_fds():
+    """Return the set of open file descriptors of this process which
+    are inheritable -- *i.e.* not marked close-on-exec.
+
+    Open descriptors are listed from `/proc/self/fd` or `/dev/fd`
+    where available -- and otherwise probed up to the process limit.
+
+    """
+    for fd_dir in ('/proc/self/fd', '/dev/fd'):
+        try:
+            candidates = [int(name) for name in os.listdir(fd_dir)]
+        except FileNotFoundError:
+            continue
+        else:
+            break
+    else:
+        candidates = range(os.sysconf('SC_OPEN_MAX'))
+
+    fds = set()
+
+    for fd in candidates:
+        try:
+            if os.get_inheritable(fd):
+                fds.add(fd)
+        except OSError:
+            # not open -- (e.g. the descriptor of the listing itself)
+            pass
+
+    return fds
@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import io
 import os
+import selectors
+import tempfile
 import threading
-import time
 import typing
 from dataclasses import dataclass, field
 
@@ -20,7 +21,10 @@ class BufferedOutput:
     configuration, the `receive` method may be invoked regularly,
     without needlessly blocking execution. Any data that is received may
     be inspected at `data` or by casting the `BufferedOutput` object
-    itself to `bytes` or `str`. (Note that this data may be incomplete.)
+    itself to `bytes` or `str`; (and its size measured without copy via
+    `len`). (Note that this data may be incomplete.) As a sized object,
+    a `BufferedOutput` which has received no data is false: test for
+    `None`, rather than truth, to determine whether an output exists.
 
     Alternatively, a file with a blocking descriptor (the language
     default) may be given. In this case, `receive` will block until the
@@ -28,36 +32,77 @@ class BufferedOutput:
 
     """
     file: typing.BinaryIO
-    data: bytes = field(default=b'', init=False)
+
+    # growable buffer (until closed, when it's traded for immutable bytes)
+    data: typing.Union[bytearray, bytes] = field(default_factory=bytearray, init=False)
 
     def __bytes__(self) -> bytes:
-        return self.data
+        # (without copy once data is frozen)
+        return bytes(self.data)
 
     def __str__(self) -> str:
         return self.data.decode()
 
+    def __len__(self) -> int:
+        return len(self.data)
+
     def __iadd__(self, chunk) -> BufferedOutput:
+        # extend in place (rather than copy all data thus far)
         self.data += chunk
         return self
 
-    def receive(self) -> None:
-        # data may be empty/None so we test it
-        if read := self.file.read():
-            self += read
+    # maximum size of each read
+    _readsize_ = 1 << 17
+
+    def receive(self, ready: bool = False) -> bool:
+        """Read all available data and return whether the file may yet
+        produce more (*i.e.* it has not reached end-of-file).
+
+        Where the file was reported `ready` by a selector, a short read
+        is taken to have drained it -- (the selector will report any
+        further data) -- sparing a final read, which would only block.
+
+        """
+        if self.file.closed:
+            return False
+
+        fd = self.file.fileno()
+
+        # drain descriptor (until it would block or is exhausted)
+        while True:
+            try:
+                chunk = os.read(fd, self._readsize_)
+            except BlockingIOError:
+                return True
+
+            if not chunk:
+                return False
+
+            self += chunk
+
+            if ready and len(chunk) < self._readsize_:
+                return True
 
     def close(self) -> None:
         self.file.close()
 
+        # data is complete: hold it once, as bytes, rather than keep the
+        # buffer and copy it upon each cast
+        self.data = bytes(self.data)
+
 
 @dataclass(eq=False)
 class StagedOutput(BufferedOutput):
     """High-performance buffer of data read from a given file object.
 
     StagedOutput operates like BufferedOutput, with the distinction that
-    data is initially "staged", (in an internal list), for improved
+    data is initially "staged", (in an internal buffer), for improved
     performance. Upon close, this staged data is gathered into user-
     readable data, (available by casting the object to str or bytes).
 
+    Staged data in excess of `_spoolsize_` is spooled to a temporary
+    file, such that large outputs do not occupy memory until closed.
+
     The descriptor of the given file object is presumed to be non-
     blocking. This implementation is only necessary when performing very
     large numbers of repeated read operations.
@@ -65,44 +110,160 @@ class StagedOutput(BufferedOutput):
     See: `ProgressiveOutput`.
 
     """
-    _stage: list = field(default_factory=list, init=False)
+    _stage: bytearray = field(default_factory=bytearray, init=False)
+
+    _spool: typing.Optional[typing.BinaryIO] = field(default=None, init=False, repr=False)
+
+    _spoolsize_ = 8 << 20
 
     def __iadd__(self, chunk) -> StagedOutput:
-        self._stage.append(chunk)
+        if self._spool is None and len(self._stage) + len(chunk) > self._spoolsize_:
+            self._spool = tempfile.TemporaryFile()
+            self._spool.write(self._stage)
+            self._stage.clear()
+
+        if self._spool is None:
+            self._stage += chunk
+        else:
+            self._spool.write(chunk)
+
         return self
 
     def close(self) -> None:
-        super().close()
-        self.data += b''.join(self._stage)
-        self._stage.clear()
+        self.file.close()
+
+        # gather staged data into (frozen) data -- in a single allocation --
+        # releasing the stage
+        if self._spool is None:
+            self.data = bytes(self._stage)
+            self._stage = bytearray()
+        else:
+            # (the stage was emptied into the spool)
+            with self._spool as spool:
+                spool.seek(0)
+                self.data = spool.read()
+
+            self._spool = None
+
+
+class OutputPump(threading.Thread):
+    """Daemon thread reading any number of registered outputs as their
+    data becomes available.
+
+    Rather than dedicate a thread to each output -- polling its file --
+    a single `selectors` loop waits upon the readiness of all
+    registered files, (as reported by the operating system).
 
+    Outputs are registered via `register` and removed via `unregister`
+    or upon reaching end-of-file. Registration may be made from any
+    thread.
 
-class ProgressiveOutput(StagedOutput, threading.Thread):
-    """Buffer of data which may be read from the given file object in a
+    See: `OutputPump.get`.
+
+    """
+    _instance_ = None
+
+    _instance_lock_ = threading.Lock()
+
+    @classmethod
+    def get(cls) -> OutputPump:
+        """Retrieve the process's pump -- started upon first retrieval."""
+        with cls._instance_lock_:
+            if cls._instance_ is None:
+                cls._instance_ = cls()
+                cls._instance_.start()
+
+            return cls._instance_
+
+    @classmethod
+    def _reset_(cls) -> None:
+        # the pump's thread does not survive a fork
+        cls._instance_ = None
+        cls._instance_lock_ = threading.Lock()
+
+    def __init__(self):
+        super().__init__(name='Reader (pump)', daemon=True)
+        self._selector = selectors.DefaultSelector()
+        self._lock = threading.Lock()
+
+        # self-pipe with which to interrupt select() upon (un)registration
+        (self._wakeup_output, self._wakeup_input) = os.pipe()
+        os.set_blocking(self._wakeup_output, False)
+        os.set_blocking(self._wakeup_input, False)
+        self._selector.register(self._wakeup_output, selectors.EVENT_READ)
+
+    def _wakeup(self) -> None:
+        try:
+            os.write(self._wakeup_input, b'\0')
+        except BlockingIOError:
+            # pipe is full: select() has a wakeup pending regardless
+            pass
+
+    def register(self, output: ProgressiveOutput) -> None:
+        with self._lock:
+            self._selector.register(output.file, selectors.EVENT_READ, output)
+
+        self._wakeup()
+
+    def unregister(self, output: ProgressiveOutput) -> None:
+        with self._lock:
+            try:
+                self._selector.unregister(output.file)
+            except (KeyError, ValueError):
+                # already unregistered (upon end-of-file)
+                pass
+
+    def run(self):
+        while True:
+            events = self._selector.select()
+
+            with self._lock:
+                for (key, _mask) in events:
+                    if key.data is None:
+                        # wakeup: drain pipe
+                        try:
+                            while os.read(self._wakeup_output, io.DEFAULT_BUFFER_SIZE):
+                                pass
+                        except BlockingIOError:
+                            pass
+
+                        continue
+
+                    if self._selector.get_map().get(key.fd) is not key:
+                        # unregistered since select() returned
+                        continue
+
+                    if not key.data.receive(ready=True):
+                        self._selector.unregister(key.fileobj)
+
+
+os.register_at_fork(after_in_child=OutputPump._reset_)
+
+
+@dataclass(eq=False)
+class ProgressiveOutput(StagedOutput):
+    """Buffer of data which is read from the given file object in a
     parallel thread.
 
     As a StagedOutput, the descriptor of the given file object is
-    presumed to have been set non-blocking. A new daemon thread may be
-    launched via the `start` method, which will (repeatedly) read the
-    given file and store its output.
+    presumed to have been set non-blocking. Upon `start`, the object is
+    registered with the process's `OutputPump`, which reads the given
+    file as data becomes available, and stores its output.
 
     Read data may be made available for inspection, and the read file
     closed, via the `stop` (alias `close`) method.
 
     """
-    def __init__(self, file: typing.BinaryIO, thread_name: str | None):
-        super().__init__(file)
-        threading.Thread.__init__(self, name=thread_name, daemon=True)
-        self._closed = threading.Event()
+    def start(self) -> None:
+        OutputPump.get().register(self)
 
-    def run(self):
-        while not self._closed.is_set():
-            time.sleep(1e-6)
+    def close(self) -> None:
+        OutputPump.get().unregister(self)
+
+        # collect anything which arrived since last read
+        if not self.file.closed:
             self.receive()
 
-    def close(self):
-        self._closed.set()
-        self.join()
         super().close()
 
     stop = close
@@ -128,6 +289,11 @@ class BufferedInput:
     def datasize(self):
         return len(self.data)
 
+    @cachedproperty
+    def dataview(self):
+        # chunks are sliced from a view of data (rather than copied)
+        return memoryview(self.data)
+
     @property
     def finished(self) -> bool:
         return self.file.closed
@@ -136,22 +302,35 @@ class BufferedInput:
         if self.finished:
             return
 
-        chunk = self.data[self.position:self.buffersize]
-        self.file.write(chunk)
+        chunk = self.dataview[self.position:(self.position + self.buffersize)]
 
-        self.position = min(self.position + self.buffersize, self.datasize)
+        try:
+            # write to the descriptor directly: a non-blocking write may be
+            # partial, and only what was written may be counted as sent
+            self.position += os.write(self.file.fileno(), chunk)
+        except BlockingIOError:
+            # pipe full: try again later
+            return
+        except BrokenPipeError:
+            # reader gone: nothing more may be sent
+            self.position = self.datasize
 
-        if self.position == self.datasize:
+        if self.position >= self.datasize:
             try:
                 self.file.close()
             except BrokenPipeError:
                 pass
 
 
-def progressive_output(file: typing.BinaryIO, name: str | None) -> ProgressiveOutput:
-    """Launch a `ProgressiveOutput` reader in a parallel thread."""
+def progressive_output(file: typing.BinaryIO) -> ProgressiveOutput:
+    """Register a `ProgressiveOutput` reader with the process's
+    `OutputPump`.
+
+    The descriptor of the given file is set non-blocking.
+
+    """
     os.set_blocking(file.fileno(), False)
-    reader = ProgressiveOutput(file, name)
+    reader = ProgressiveOutput(file)
     reader.start()
     return reader
 
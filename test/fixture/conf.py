@@ -1,3 +1,5 @@
+import os
+
 import toml
 import yaml
 
@@ -15,9 +17,16 @@ class ConfFixture:
     def _init_paths_(path_base, extension):
         path_base.mkdir(exist_ok=True)
 
-        for conf_name in ('defaults', 'tasks'):
-            conf_path = path_base / f'{conf_name}.{extension}'
-            conf_path.touch()
+        # create files relative to their directory (rather than resolve each path)
+        dir_fd = os.open(path_base, os.O_RDONLY | os.O_DIRECTORY)
+
+        try:
+            for conf_name in ('defaults', 'tasks'):
+                fd = os.open(f'{conf_name}.{extension}', os.O_WRONLY | os.O_CREAT | os.O_CLOEXEC,
+                             0o644, dir_fd=dir_fd)
+                os.close(fd)
+        finally:
+            os.close(dir_fd)
 
     def __init__(self, path_base, extension):
         self._init_paths_(path_base, extension)
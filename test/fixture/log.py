@@ -1,9 +1,19 @@
+import collections
 import contextlib
+import functools
 import re
 
 import loguru
 
 
+# patterns of logged fields by value type: (key, value) -> regex source
+FIELD_NUMBER = r'\b%s=%s\b'
+
+FIELD_STRING = r'\b%s=[\'"]%s[\'"]\s'
+
+FIELD_STRING_PARTIAL = r'\b%s=[\'"][^\'"]*%s[^\'"]*[\'"][\b\n]'
+
+
 class LogCapture:
 
     @classmethod
@@ -20,7 +30,8 @@ class LogCapture:
         if not isinstance(level, loguru._logger.Level):
             level = logger._base_logger.level(level)
 
-        self.capture = []
+        # (appended without the reallocation of a growing list)
+        self.capture = collections.deque()
         self.logger = logger
         self.handler_id = self.logger._add_sink(self.capture.append, level=level)
 
@@ -34,27 +45,37 @@ class LogCapture:
         yield from self.capture
 
     @staticmethod
+    @functools.lru_cache(maxsize=None, typed=True)
     def _field_pattern(key, value, partial=False):
         if isinstance(value, (int, float)):
             if partial:
                 raise TypeError
 
-            return re.compile(rf'\b{key}={value}\b')
+            template = FIELD_NUMBER
+        elif isinstance(value, str):
+            template = FIELD_STRING_PARTIAL if partial else FIELD_STRING
+        else:
+            raise TypeError
 
-        if isinstance(value, str):
-            if partial:
-                return re.compile(rf'\b{key}=[\'"][^\'"]*{value}[^\'"]*[\'"][\b\n]')
+        return re.compile(template % (re.escape(key), re.escape(str(value))))
 
-            return re.compile(rf'\b{key}=[\'"]{value}[\'"]\s')
+    @staticmethod
+    def _fields_pattern(patterns):
+        # single alternation of the given field patterns, (each a named group),
+        # s.t. one scan of a message finds all of its matching fields
+        return re.compile('|'.join(f'(?P<field{index}>{pattern.pattern})'
+                                   for (index, pattern) in enumerate(patterns)))
 
-        raise TypeError
+    @staticmethod
+    def _fields_match(pattern, count, message):
+        return len({match.lastgroup for match in pattern.finditer(message)}) == count
 
     def field_contains(self, **pairs):
+        pattern = self._fields_pattern(self._field_pattern(key, text, partial=True)
+                                       for (key, text) in pairs.items())
+
         for message in self.capture:
-            if all(
-                self._field_pattern(key, text, partial=True).search(message)
-                for (key, text) in pairs.items()
-            ):
+            if self._fields_match(pattern, len(pairs), message):
                 return True
         else:
             return False
@@ -65,16 +86,10 @@ class LogCapture:
         return found > 0 if count is None else found == count
 
     def field_count(self, **pairs):
-        found = 0
-
-        for message in self.capture:
-            for (key, value) in pairs.items():
-                if not self._field_pattern(key, value).search(message):
-                    break
-            else:
-                found += 1
+        pattern = self._fields_pattern(self._field_pattern(key, value)
+                                       for (key, value) in pairs.items())
 
-        return found
+        return sum(self._fields_match(pattern, len(pairs), message) for message in self.capture)
 
     def message_contains(self, text):
         return any(text in message for message in self.capture)
@@ -3,7 +3,8 @@ import time
 
 class StopWatch:
 
-    def __init__(self):
+    def __init__(self, clock=time.perf_counter):
+        self.clock = clock
         self.started = None
         self.stopped = None
 
@@ -11,7 +12,7 @@ class StopWatch:
         if self.started is not None:
             raise ValueError("already started")
 
-        self.started = time.time()
+        self.started = self.clock()
 
     def stop(self):
         if self.started is None:
@@ -20,7 +21,7 @@ class StopWatch:
         if self.stopped is not None:
             raise ValueError("already stopped")
 
-        self.stopped = time.time()
+        self.stopped = self.clock()
 
     @property
     def seconds(self):
@@ -4,14 +4,14 @@ import functools
 import signal
 import sys
 import typing
-import weakref
 
 
 class timeout:
 
     disabling_events = frozenset(['pdb.Pdb'])
 
-    _running = weakref.WeakSet()
+    # enabled timeouts (most recent last)
+    _running = []
 
     @classmethod
     def _audit_hook(cls, name: str, *args) -> None:
@@ -19,6 +19,11 @@ class timeout:
             for timeout in list(cls._running):
                 timeout.disable()
 
+    @classmethod
+    def _handle_alarm(cls, signum, frame) -> None:
+        if cls._running:
+            cls._running[-1].raise_timeout(signum, frame)
+
     def __init__(self, seconds: float) -> None:
         self.seconds = seconds
 
@@ -38,15 +43,16 @@ class timeout:
         return wrapped
 
     def enable(self) -> None:
-        signal.signal(signal.SIGALRM, self.raise_timeout)
-        signal.alarm(self.seconds)
+        self._running.append(self)
 
-        self._running.add(self)
+        # (unlike alarm, the interval timer supports fractional seconds)
+        signal.setitimer(signal.ITIMER_REAL, self.seconds)
 
     def disable(self) -> None:
-        signal.alarm(0)
+        signal.setitimer(signal.ITIMER_REAL, 0)
 
-        self._running.discard(self)
+        if self in self._running:
+            self._running.remove(self)
 
     def raise_timeout(self, signum, frame) -> None:
         raise self.Timeout(self.seconds, signum, frame)
@@ -66,3 +72,5 @@ class timeout:
 
 
 sys.addaudithook(timeout._audit_hook)
+
+signal.signal(signal.SIGALRM, timeout._handle_alarm)
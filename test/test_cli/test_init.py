@@ -0,0 +1,186 @@
+import json
+import pathlib
+import sys
+
+import argcomplete
+import pytest
+
+import fate.cli
+from fate.cli.command.init import Comp, StatusSymbol
+
+
+@pytest.fixture
+def login_shell(monkeypatch, tmp_path):
+    """Set the login shell to the path `bash` under a temporary
+    directory, (and clear the cached default shell around each use).
+
+    """
+    shell_path = tmp_path / 'bash'
+
+    monkeypatch.setenv('SHELL', str(shell_path))
+
+    Comp.Shell.get_default.cache_clear()
+    yield shell_path
+    Comp.Shell.get_default.cache_clear()
+
+
+def test_shell_default(login_shell):
+    login_shell.touch(mode=0o755)
+    assert Comp.Shell.get_default() is Comp.Shell.bash
+
+
+def test_shell_default_missing(login_shell):
+    assert Comp.Shell.get_default() is None
+
+
+def test_shell_default_directory(login_shell):
+    login_shell.mkdir()
+    assert Comp.Shell.get_default() is None
+
+
+def test_shell_default_cached(login_shell):
+    login_shell.touch(mode=0o755)
+    assert Comp.Shell.get_default() is Comp.Shell.bash
+
+    # the default is inferred once per process
+    login_shell.unlink()
+    assert Comp.Shell.get_default() is Comp.Shell.bash
+
+
+@pytest.fixture
+def comp(capsys, confpatch, monkeypatch, tmp_path):
+    """Install (bash) shell completion to a temporary path, (with its
+    cache under a temporary prefix).
+
+    The returned function invokes the command with any additional
+    arguments given, and returns the path to which completion was
+    installed and whether it was initially found to be up to date.
+
+    """
+    cache_path = tmp_path / 'cache'
+    target_path = tmp_path / 'completions' / 'fate'
+
+    monkeypatch.setenv('FATE_PREFIX_CACHE', str(cache_path))
+
+    def invoke(*args):
+        monkeypatch.setattr(sys, 'argv', ['fate', 'init', '--no-prompt',
+                                          'comp', '--shell', 'bash', *args, str(target_path)])
+
+        fate.cli.main()
+
+        (stdout, _stderr) = capsys.readouterr()
+
+        return (target_path, stdout.startswith(StatusSymbol.complete))
+
+    invoke.manifest_path = cache_path / 'comp' / 'manifest.json'
+
+    return invoke
+
+
+def read_manifest(comp):
+    return json.loads(comp.manifest_path.read_text())
+
+
+def shellcode_unavailable(*args, **kwargs):
+    raise AssertionError('shellcode regenerated')
+
+
+def file_unread(path):
+    raise AssertionError(f'file read: {path}')
+
+
+def test_comp_cache_hit(comp, monkeypatch):
+    (path, syncd) = comp()
+    assert not syncd
+
+    contents = path.read_bytes()
+    assert contents
+
+    assert str(path) in read_manifest(comp)
+
+    # neither the shellcode nor the installed file should be needed again
+    monkeypatch.setattr(argcomplete, 'shellcode', shellcode_unavailable)
+    monkeypatch.setattr(pathlib.Path, 'read_bytes', file_unread)
+
+    (path, syncd) = comp()
+    assert syncd
+
+    monkeypatch.undo()
+
+    assert path.read_bytes() == contents
+
+
+def test_comp_cache_invalidation(comp):
+    (path, _syncd) = comp()
+
+    contents = path.read_bytes()
+    fingerprint = read_manifest(comp)[str(path)]
+
+    # installed file changed out from under the manifest
+    path.write_bytes(b'# local changes\n')
+
+    (path, syncd) = comp()
+    assert not syncd
+
+    assert path.read_bytes() == contents
+    assert read_manifest(comp)[str(path)] != fingerprint
+
+
+def test_comp_no_cache(comp, monkeypatch):
+    (path, _syncd) = comp()
+
+    contents = path.read_bytes()
+    manifest = comp.manifest_path.read_bytes()
+
+    # poison the cached shellcode
+    (cache_path,) = comp.manifest_path.parent.glob('bash-*')
+    cache_path.write_text('# stale\n')
+
+    (path, syncd) = comp('--no-cache')
+    assert syncd
+
+    assert path.read_bytes() == contents
+
+    # cache was neither consulted nor updated
+    assert cache_path.read_text() == '# stale\n'
+    assert comp.manifest_path.read_bytes() == manifest
+
+
+def test_comp_no_cache_cold(comp):
+    (path, syncd) = comp('--no-cache')
+    assert not syncd
+
+    assert path.read_bytes()
+    assert not comp.manifest_path.parent.exists()
+
+
+@pytest.mark.parametrize('manifest', (
+    '{"',     # partial write
+    '\0\0',   # garbage
+    '[]',     # unexpected structure
+))
+def test_comp_cache_corrupt(comp, manifest):
+    (path, _syncd) = comp()
+
+    contents = path.read_bytes()
+
+    comp.manifest_path.write_text(manifest)
+
+    (path, syncd) = comp()
+    assert syncd
+
+    assert path.read_bytes() == contents
+    assert str(path) in read_manifest(comp)
+
+
+def test_comp_cache_partial_entry(comp):
+    (path, _syncd) = comp()
+
+    manifest = read_manifest(comp)
+    manifest[str(path)] = manifest[str(path)][:1]
+    comp.manifest_path.write_text(json.dumps(manifest))
+
+    (path, syncd) = comp()
+    assert syncd
+
+    assert len(read_manifest(comp)[str(path)]) == 3
@@ -0,0 +1,25 @@
+from fate.common.log import LogReader
+
+
+class TestLogReader:
+
+    def test_read(self):
+        reader = LogReader(bytearray(b'alpha\0beta\0\0gam'))
+
+        assert list(reader.read()) == [b'alpha', b'beta']
+        assert list(reader.read(final=True)) == [b'gam']
+        assert list(reader.read(final=True)) == []
+
+    def test_receive_during_read(self):
+        data = bytearray(b'alpha\0beta\0')
+        reader = LogReader(data)
+
+        records = reader.read()
+
+        assert next(records) == b'alpha'
+
+        # the stream's data must remain growable while its reader is suspended
+        data += b'gamma\0'
+
+        assert list(records) == [b'beta']
+        assert list(reader.read()) == [b'gamma']
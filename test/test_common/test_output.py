@@ -1,12 +1,14 @@
 import io
 import json
+import os
 import pytest
 import tarfile
-
-import toml
+import tracemalloc
 
 import fate.conf
 from fate.common.output import TaskOutput
+from fate.util.format import Dumper, Loader, SLoader, load_file
+from fate.util.stream import StagedOutput
 
 
 class TarBytes:
@@ -37,6 +39,17 @@ class TarBytes:
     def __bytes__(self):
         return self.getvalue()
 
+    def pre_posix(self):
+        """Archive bytes with the first header recast as pre-POSIX (*i.e.*
+        lacking the ustar magic), its checksum computed by tarfile.
+
+        """
+        data = bytearray(self.getvalue())
+        data[257:265] = bytes(8)
+        (checksum, _signed) = tarfile.calc_chksums(data[:tarfile.BLOCKSIZE])
+        data[148:156] = b'%06o\0 ' % checksum
+        return bytes(data)
+
 
 class TestIterArchive:
 
@@ -44,6 +57,12 @@ class TestIterArchive:
     def setup_class(cls):
         cls.conf = fate.conf.get()
 
+        # encapsulated archive shared by archive tests
+        with TarBytes('gz') as encap:
+            encap.add_content('special.json', b'{"alpha": "beta"}')
+
+        cls.encap = bytes(encap)
+
     @classmethod
     def list_archive(cls, stdout: bytes, *args, **kwargs):
         if not args:
@@ -77,48 +96,39 @@ class TestIterArchive:
             self.list_archive(bytes(target), archive_mode=TaskOutput.ArchiveMode.detect)
 
     def test_detect_bad_marker(self):
-        with TarBytes('gz') as encap:
-            encap.add_content('special.json', b'{"alpha": "beta"}')
-
         with TarBytes() as target:
             target.add_content('.fate', b'')
             target.add_content('results.json', b'{"foo": "bar"}')
-            target.add_content('special.json.tar.gz', bytes(encap))
+            target.add_content('special.json.tar.gz', self.encap)
 
         with pytest.raises(TaskOutput.NonArchiveError):
             self.list_archive(bytes(target), archive_mode=TaskOutput.ArchiveMode.detect)
 
     def test_detect_marker(self):
-        with TarBytes('gz') as encap:
-            encap.add_content('special.json', b'{"alpha": "beta"}')
-
         with TarBytes() as target:
             target.add_directory('.fate')
             target.add_content('results.json', b'{"foo": "bar"}')
-            target.add_content('special.json.tar.gz', bytes(encap))
+            target.add_content('special.json.tar.gz', self.encap)
 
         assert self.list_archive(
             bytes(target),
             archive_mode=TaskOutput.ArchiveMode.detect,
         ) == [
             TaskOutput(value=b'{"foo": "bar"}', label='results', ext='.json'),
-            TaskOutput(value=bytes(encap), label='special', ext='.json.tar.gz'),
+            TaskOutput(value=self.encap, label='special', ext='.json.tar.gz'),
         ]
 
     def test_archive(self):
-        with TarBytes('gz') as encap:
-            encap.add_content('special.json', b'{"alpha": "beta"}')
-
         with TarBytes() as target:
             target.add_content('results.json', b'{"foo": "bar"}')
-            target.add_content('special.json.tar.gz', bytes(encap))
+            target.add_content('special.json.tar.gz', self.encap)
 
         assert self.list_archive(
             bytes(target),
             archive_mode=TaskOutput.ArchiveMode.archive,
         ) == [
             TaskOutput(value=b'{"foo": "bar"}', label='results', ext='.json'),
-            TaskOutput(value=bytes(encap), label='special', ext='.json.tar.gz'),
+            TaskOutput(value=self.encap, label='special', ext='.json.tar.gz'),
         ]
 
 
@@ -140,6 +150,28 @@ class TestDetectFormat:
     def test_auto_toml(self):
         assert TaskOutput.detect_format(b'foo = "bar"', ['auto']) == ('.toml', [])
 
+    def test_auto_json_whitespace(self):
+        assert TaskOutput.detect_format(b'\n  {"foo": "bar"}', ['auto']) == ('.json', [])
+
+    def test_auto_toml_comment(self):
+        # (a document of only comments is also valid YAML)
+        assert TaskOutput.detect_format(b'# foo\n\n# bar\n', ['auto']) == ('.toml', [])
+
+    def test_auto_toml_table(self):
+        # (a leading "[" admits JSON as well)
+        assert TaskOutput.detect_format(b'[foo]\nbar = 1', ['auto']) == ('.toml', [])
+
+    def test_auto_whitespace(self):
+        assert TaskOutput.detect_format(b' \n\t\n', ['auto']) == ('.toml', [])
+
+    def test_auto_yaml_fallthrough(self):
+        # admitted by TOML's sniff (for its "=") but only YAML may decode
+        assert TaskOutput.detect_format(b'foo: bar = baz', ['auto']) == ('.yaml', [])
+
+    def test_auto_yaml_sequence(self):
+        # admitted by neither JSON's nor TOML's sniff
+        assert TaskOutput.detect_format(b'- foo\n- bar', ['auto']) == ('.yaml', [])
+
     def test_auto_tar(self):
         with TarBytes() as archive:
             archive.add_content('results.json', b'{"foo": "bar"}')
@@ -152,6 +184,36 @@ class TestDetectFormat:
 
         assert TaskOutput.detect_format(bytes(archive), ['auto']) == ('.tar.gz', [])
 
+    def test_auto_tar_pre_posix(self):
+        # no ustar magic: recognized by its checksum
+        with TarBytes() as archive:
+            archive.add_content('results.json', b'{"foo": "bar"}')
+
+        assert TaskOutput.detect_format(archive.pre_posix(), ['auto']) == ('.tar', [])
+
+    def test_auto_tar_empty(self):
+        # an empty archive is only its zeroed end-of-archive blocks
+        with TarBytes() as archive:
+            pass
+
+        assert TaskOutput.detect_format(bytes(archive), ['auto']) == ('.tar', [])
+
+    def test_auto_tar_corrupt(self):
+        with TarBytes() as archive:
+            archive.add_content('results.json', b'{"foo": "bar"}')
+
+        # alter the name s.t. the header no longer matches its checksum
+        corrupt = bytearray(archive.pre_posix())
+        corrupt[0] ^= 0xff
+
+        assert TaskOutput.detect_format(bytes(corrupt), ['auto']) == ('', [])
+
+    def test_auto_tar_short(self):
+        with TarBytes() as archive:
+            archive.add_content('results.json', b'{"foo": "bar"}')
+
+        assert TaskOutput.detect_format(bytes(archive)[:300], ['auto']) == ('', [])
+
     def test_auto_csv_fail(self):
         assert TaskOutput.detect_format(b'foo,bar', ['auto']) == ('', [])
 
@@ -177,7 +239,7 @@ class TestDetectFormat:
     def test_format_deserialize_error(self):
         (suffix, errors) = TaskOutput.detect_format(b'foo: bar', ('toml', 'json'))
         assert suffix == ''
-        assert {type(error) for error in errors} == {json.JSONDecodeError, toml.TomlDecodeError}
+        assert {type(error) for error in errors} == {json.JSONDecodeError, SLoader.toml.raises}
 
 
 class TestParse:
@@ -233,4 +295,103 @@ class TestParse:
         assert ctx.value.output == TaskOutput(b'foo: bar')
         assert ctx.value.format == ('toml', 'json')
         assert {type(error) for error in ctx.value.errors} == {json.JSONDecodeError,
-                                                               toml.TomlDecodeError}
+                                                               SLoader.toml.raises}
+
+
+class TestLoadJSON:
+
+    def test_big_integer(self):
+        # integers beyond 64 bits must not be decoded (lossily) as floats
+        data = {'big': 2 ** 64, 'bigger': -(10 ** 30)}
+
+        loaded = SLoader.json(Dumper.json(data))
+
+        assert loaded == data
+        assert all(type(value) is int for value in loaded.values())
+
+
+class TestLoadFile:
+
+    def test_cache_hit(self, tmp_path):
+        path = tmp_path / 'conf.json'
+        path.write_text('{"alpha": ["beta"]}')
+
+        parsed = []
+
+        def sloader(text):
+            parsed.append(text)
+            return SLoader.json(text)
+
+        data0 = load_file(sloader, path)
+        data1 = load_file(sloader, path)
+
+        assert data0 == data1 == {'alpha': ['beta']}
+        assert data0 is not data1
+        assert len(parsed) == 1
+
+    def test_rewrite(self, tmp_path):
+        path = tmp_path / 'conf.yaml'
+        path.write_text('alpha: 1\n')
+
+        assert Loader.yaml(path) == {'alpha': 1}
+
+        # rewrite at the same size and (as within timestamp resolution) mtime
+        stat = path.stat()
+        path.write_text('alpha: 2\n')
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert Loader.yaml(path) == {'alpha': 2}
+
+    def test_mutation(self, tmp_path):
+        path = tmp_path / 'conf.yaml'
+        path.write_text('items: [1, 2]\ntags: !!set {alpha, beta}\n')
+
+        data0 = Loader.yaml(path)
+        data0['items'].append(3)
+        data0['tags'].add('gamma')
+
+        assert Loader.yaml(path) == {'items': [1, 2], 'tags': {'alpha', 'beta'}}
+
+
+class TestStagedOutput:
+
+    @staticmethod
+    def stage(data, spoolsize):
+        (output, input_) = os.pipe()
+        os.close(input_)
+
+        staged = StagedOutput(open(output, 'rb', buffering=0))
+        staged._spoolsize_ = spoolsize
+
+        for offset in range(0, len(data), 1 << 20):
+            staged += data[offset:offset + (1 << 20)]
+
+        return staged
+
+    @classmethod
+    def close_peak(cls, data, spoolsize):
+        staged = cls.stage(data, spoolsize)
+
+        tracemalloc.start()
+
+        try:
+            staged.close()
+            (_size, peak) = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert bytes(staged) == data
+
+        return peak
+
+    def test_close_staged(self):
+        data = os.urandom(4 << 20)
+
+        # staged data is copied once to frozen data -- and not again
+        assert self.close_peak(data, len(data) + 1) < len(data) * 1.5
+
+    def test_close_spooled(self):
+        data = os.urandom(16 << 20)
+
+        # spooled data is read once into frozen data -- not via the stage
+        assert self.close_peak(data, 1 << 20) < len(data) * 1.5
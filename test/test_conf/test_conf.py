@@ -0,0 +1,60 @@
+import os
+
+
+def scandir_listing(names):
+    """Stand-in for `os.scandir` which lists the given file names."""
+    class Entry:
+
+        def __init__(self, name):
+            self.name = name
+
+        def is_file(self):
+            return True
+
+    class Listing(list):
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            pass
+
+    return lambda _path: Listing(Entry(name) for name in names)
+
+
+def scandir_denied(_path):
+    raise PermissionError
+
+
+def test_path(confpatch):
+    conf_path = confpatch.conf.default.__path__
+
+    assert conf_path.name == 'defaults.yaml'
+    assert conf_path.is_file()
+
+
+def test_path_unreadable_prefix(confpatch, monkeypatch):
+    # a prefix which may be searched but not listed
+    monkeypatch.setattr(os, 'scandir', scandir_denied)
+
+    conf_path = confpatch.conf.default.__path__
+
+    assert conf_path.name == 'defaults.yaml'
+
+
+def test_path_case_insensitive(confpatch, monkeypatch):
+    # the file system lists the file by another case -- yet finds it by ours
+    monkeypatch.setattr(os, 'scandir', scandir_listing(['Defaults.YAML', 'tasks.yaml']))
+
+    conf_path = confpatch.conf.default.__path__
+
+    assert conf_path.name == 'defaults.yaml'
+
+
+def test_path_case_sensitive(confpatch, monkeypatch):
+    # the file system lists a file by another case -- and doesn't find it by ours
+    (confpatch.conf.default._indicator_.parent / 'defaults.yaml').unlink()
+
+    monkeypatch.setattr(os, 'scandir', scandir_listing(['Defaults.YAML', 'tasks.yaml']))
+
+    assert confpatch.conf.default._get_path_() is None
@@ -0,0 +1,81 @@
+import contextlib
+import hashlib
+import os
+
+from fate import sched
+
+
+def hash_conf(conf, hasher):
+    conf_paths = sorted(os.fsencode(conf_file.__path__) for conf_file in conf)
+    hasher.update(os.fsencode(os.pathsep).join(conf_paths))
+    return hasher.hexdigest()
+
+
+def test_path_state_migrate_legacy(confpatch, monkeypatch):
+    #
+    # set up stale state directories named for both the current (BLAKE2b)
+    # and the legacy (MD5) hash of the conf
+    #
+    state_prefix = confpatch.conf._prefix_.state
+
+    file_hash = hash_conf(confpatch.conf, hashlib.blake2b(digest_size=16))
+    legacy_hash = hash_conf(confpatch.conf, hashlib.md5())
+
+    path_current = state_prefix / f'stale-{file_hash}'
+    path_legacy = state_prefix / f'stale-{legacy_hash}'
+
+    for (path, marker) in ((path_current, 'current'), (path_legacy, 'legacy')):
+        path.mkdir(parents=True)
+        (path / 'marker').write_text(marker)
+
+    #
+    # list the legacy directory first (scandir order is otherwise arbitrary)
+    #
+    scandir = os.scandir
+
+    def scandir_legacy_first(path):
+        with scandir(path) as entries:
+            entries = sorted(entries, key=lambda entry: not entry.name.endswith(legacy_hash))
+
+        return contextlib.nullcontext(entries)
+
+    monkeypatch.setattr(os, 'scandir', scandir_legacy_first)
+
+    #
+    # the current directory should be migrated -- and the legacy ignored
+    #
+    with confpatch.caplog() as logs:
+        scheduler = sched.TieredTenancyScheduler(confpatch.conf, confpatch.logger)
+        path_state = scheduler.path_state
+
+    assert path_state.name.endswith(f'-{file_hash}')
+    assert (path_state / 'marker').read_text() == 'current'
+
+    assert not path_current.exists()
+    assert path_legacy.exists()
+
+    assert logs.field_equals(msg='ignoring additional stale state directories')
+
+
+def test_check_state(confpatch):
+    #
+    # the first check creates the check file -- there is no last check
+    #
+    timing0 = sched.TieredTenancyScheduler(confpatch.conf, confpatch.logger).timing
+
+    assert not timing0.path_check.exists()
+
+    assert timing0.last_check is None
+    assert timing0.path_check.stat().st_mtime == timing0.time_check
+
+    #
+    # subsequent checks retrieve the last and record their own -- (requiring
+    # ownership of the file but not write permission)
+    #
+    timing0.path_check.chmod(0o444)
+
+    timing1 = sched.TieredTenancyScheduler(confpatch.conf, confpatch.logger).timing
+    timing1.time_check = timing0.time_check + 60
+
+    assert timing1.last_check == timing0.time_check
+    assert timing1.path_check.stat().st_mtime == timing1.time_check
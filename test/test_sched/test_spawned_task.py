@@ -0,0 +1,247 @@
+import fcntl
+import os
+import signal
+import sys
+import textwrap
+
+from fate import sched
+from fate.sched.base.task.invoked_task import spawned_task
+from fate.sched.base.task.invoked_task.spawned_task import SpawnedProcess
+from fate.util.compat.os import waitstatus_to_exitcode
+from fate.util.os import close_fds
+
+from test.fixture import timeout
+
+
+def spawn_python(script, **kwargs):
+    return SpawnedProcess.spawn(sys.executable,
+                                [sys.executable, '-c', textwrap.dedent(script)],
+                                **kwargs)
+
+
+def communicate(process):
+    """Read the process's standard output to its end and reap it."""
+    process.stdin.close()
+
+    try:
+        stdout = process.stdout.read()
+    finally:
+        process.stdout.close()
+        process.stderr.close()
+
+    (_pid, status) = os.waitpid(process.pid, 0)
+
+    return (stdout, waitstatus_to_exitcode(status))
+
+
+@timeout(2)
+def test_spawn_fds_swapped():
+    #
+    # pass two pipes -- each to the descriptor of the other -- such that
+    # each source is also the target of another
+    #
+    pipes = (os.pipe(), os.pipe())
+
+    try:
+        for (index, (_output, input_)) in enumerate(pipes):
+            os.write(input_, f'pipe {index}'.encode())
+            os.close(input_)
+
+        # (duplicate read ends to consecutive descriptors well out of the way
+        # of the child's standard descriptors)
+        fd0 = fcntl.fcntl(pipes[0][0], fcntl.F_DUPFD_CLOEXEC, 64)
+        fd1 = fcntl.fcntl(pipes[1][0], fcntl.F_DUPFD_CLOEXEC, fd0 + 1)
+
+        process = spawn_python(
+            f"""\
+            import os
+            print(os.read({fd0}, 64).decode(), os.read({fd1}, 64).decode(), sep=', ')
+            """,
+            fds={fd0: fd1, fd1: fd0},
+        )
+    finally:
+        for (output, _input) in pipes:
+            os.close(output)
+
+    (stdout, exitcode) = communicate(process)
+
+    assert exitcode == 0
+    assert stdout == b'pipe 1, pipe 0\n'
+
+    # passed descriptors are closed in the parent
+    for fd in (fd0, fd1):
+        try:
+            os.fstat(fd)
+        except OSError:
+            pass
+        else:
+            raise AssertionError(f'descriptor {fd} left open')
+
+
+@timeout(2)
+def test_spawn_process_group():
+    #
+    # spawn a child which itself forks a (long-lived) grandchild
+    #
+    process = SpawnedProcess.spawn('/bin/sh', ['sh', '-c', 'sleep 30 & echo $!; wait'])
+
+    # the child leads its own process group -- as the kill path assumes
+    assert process.pgid == process.pid
+    assert os.getpgid(process.pid) == process.pgid
+    assert process.pgid != os.getpgrp()
+
+    # grandchild pid
+    gpid = int(process.stdout.readline())
+
+    assert os.getpgid(gpid) == process.pgid
+
+    #
+    # signaling the group must end the child and the grandchild: only then
+    # is stdout (held open by both) closed
+    #
+    os.killpg(process.pgid, signal.SIGTERM)
+
+    (stdout, exitcode) = communicate(process)
+
+    assert stdout == b''
+    assert exitcode == -signal.SIGTERM
+
+
+def test_invocation_failure_stale(confpatch, schedpatch, monkeypatch, tmp_path):
+    #
+    # configure a task whose executable is found on PATH
+    #
+    bin_path = tmp_path / 'bin'
+    bin_path.mkdir()
+
+    program_path = bin_path / 'ephemeral'
+    program_path.write_text('#!/bin/sh\n')
+    program_path.chmod(0o755)
+
+    monkeypatch.setenv('PATH', f'{bin_path}{os.pathsep}{os.environ["PATH"]}')
+
+    confpatch.set_tasks(
+        {
+            'ephemeral': {
+                'exec': 'ephemeral',
+                'schedule': '0 * * * *',
+            },
+        }
+    )
+
+    #
+    # resolve the executable -- caching the result -- and only then remove it
+    #
+    spawned_task._which_cached.cache_clear()
+
+    assert spawned_task._which('ephemeral', os.environ['PATH']) == str(program_path)
+
+    program_path.unlink()
+
+    #
+    # execute scheduler: invocation should fail cleanly with the stale entry cleared
+    #
+    schedpatch.set_last_check(offset=3600)
+
+    events = list(schedpatch.scheduler())
+
+    assert len(events) == 1
+
+    (fail_event,) = events
+
+    assert isinstance(fail_event, sched.TaskInvocationFailureEvent)
+
+    assert str(fail_event.error) == 'command not found on path: ephemeral'
+
+    assert spawned_task._which('ephemeral', os.environ['PATH']) is None
+
+
+@timeout(2)
+def test_spawn_fds_closed():
+    #
+    # an inheritable descriptor of the parent (e.g. as from a supervisor)
+    # must not leak into the child
+    #
+    (output, input_) = os.pipe()
+
+    # (well out of the way of the child's own descriptors)
+    leaked = fcntl.fcntl(input_, fcntl.F_DUPFD, 64)
+
+    try:
+        os.set_inheritable(leaked, True)
+
+        process = spawn_python(
+            """\
+            import os
+            print(*os.listdir('/dev/fd'))
+            """
+        )
+    finally:
+        close_fds((output, input_, leaked))
+
+    (stdout, exitcode) = communicate(process)
+
+    assert exitcode == 0
+
+    # only the standard descriptors -- and that of the listing itself
+    assert {int(fd) for fd in stdout.split()} == {0, 1, 2, 3}
+
+
+def install_program(dir_path, name='program'):
+    dir_path.mkdir(parents=True, exist_ok=True)
+
+    program_path = dir_path / name
+    program_path.write_text('#!/bin/sh\n')
+    program_path.chmod(0o755)
+
+    return str(program_path)
+
+
+class FixedTime:
+
+    def __init__(self, time):
+        self._time_ = time
+
+    def time(self):
+        return self._time_
+
+
+def test_which_shadowed(monkeypatch, tmp_path):
+    path = os.pathsep.join((str(tmp_path / 'first'), str(tmp_path / 'second')))
+
+    clock = FixedTime(1_000_000.0)
+    monkeypatch.setattr(spawned_task, 'time', clock)
+
+    spawned_task._which_cached.cache_clear()
+
+    program_second = install_program(tmp_path / 'second')
+
+    assert spawned_task._which('program', path) == program_second
+
+    #
+    # a program installed to an earlier directory shadows the other -- once
+    # the cached resolution has expired
+    #
+    program_first = install_program(tmp_path / 'first')
+
+    assert spawned_task._which('program', path) == program_second
+
+    clock._time_ += spawned_task._WHICH_TTL
+
+    assert spawned_task._which('program', path) == program_first
+
+
+def test_which_relative(monkeypatch, tmp_path):
+    path = os.pathsep.join(('bin', '/nonexistent'))
+
+    spawned_task._which_cached.cache_clear()
+
+    program_first = install_program(tmp_path / 'first' / 'bin')
+    program_second = install_program(tmp_path / 'second' / 'bin')
+
+    # resolution against a relative path depends on the working directory
+    monkeypatch.chdir(tmp_path / 'first')
+    assert os.path.samefile(spawned_task._which('program', path), program_first)
+
+    monkeypatch.chdir(tmp_path / 'second')
+    assert os.path.samefile(spawned_task._which('program', path), program_second)
@@ -1,11 +1,10 @@
-import gzip
 import json
 import os
 import re
 import signal
 import textwrap
 import time
-from collections import deque
+import zlib
 
 import pytest
 
@@ -15,19 +14,84 @@ from fate.conf import LogRecordDecodeError
 from test.fixture import StopWatch, timeout
 
 
+STDOUT_CHILD = re.compile(rb'started: (?P<cpid>\d+) +(?P<cpgid>\d+)\n')
+
+STDOUT_GRANDCHILD = re.compile(
+    rb'started: (?P<cpid>\d+) +(?P<cpgid>\d+)\n'
+    rb'grandchild: (?P<gpid>\d+) +(?P<gpgid>\d+)\n'
+)
+
+STDOUT_GRANDCHILD_TRAP = re.compile(rb'started: (?P<gpid>\d+) +(?P<gpgid>\d+)\n')
+
+
 class TimeMock:
 
     def __init__(self, *times, sleep=time.sleep):
         self.sleep = sleep
-        self._times_ = deque(times)
-        self._past_ = []
+        self._times_ = times
+        self._index_ = 0
+
+    @property
+    def _past_(self):
+        return self._times_[:self._index_]
 
     def time(self):
-        time = self._times_.popleft()
-        self._past_.append(time)
+        # (IndexError upon exhaustion -- rather than leak StopIteration into
+        # the scheduler's generators)
+        time = self._times_[self._index_]
+        self._index_ += 1
         return time
 
 
+class TimeWarp:
+    """Stand-in for the time module whose clock runs `rate` times faster
+    than the real clock.
+
+    The clock runs at the real rate until the predicate `ready` is first
+    found true, (and is sped up from that moment).
+
+    """
+    def __init__(self, rate, clock=time.time, ready=lambda: True):
+        self.rate = rate
+        self.clock = clock
+        self.ready = ready
+        self._origin_ = None
+
+    def time(self):
+        now = self.clock()
+
+        if self._origin_ is None:
+            if not self.ready():
+                return now
+
+            self._origin_ = now
+
+        return self._origin_ + (now - self._origin_) * self.rate
+
+
+# task timeouts are tested against a clock sped up by this factor
+#
+# (such that a timeout of one "second" costs only a fraction of one)
+#
+# the clock is sped up only once the task reports that it is ready -- having
+# started up and set any traps -- by creating the file at TIMEOUT_READY_ENV
+TIMEOUT_RATE = 4
+
+TIMEOUT_READY_ENV = 'TEST_TASK_READY'
+
+
+@pytest.fixture
+def timewarp(monkeypatch, tmp_path):
+    """Patch task timing with a clock sped up upon the task's readiness."""
+    ready_path = tmp_path / 'task-ready'
+    monkeypatch.setenv(TIMEOUT_READY_ENV, str(ready_path))
+
+    clock = TimeWarp(TIMEOUT_RATE, ready=ready_path.exists)
+    monkeypatch.setattr('fate.sched.base.task.invoked_task.spawned_task.time', clock)
+
+    return clock
+
+
 def test_due(confpatch, schedpatch):
     #
     # configure a single task which should run
@@ -60,7 +124,7 @@ def test_due(confpatch, schedpatch):
     (event,) = events
     assert event.returncode == 0
     assert str(event.stdout) == 'done\n'
-    assert str(event.stderr) == ''
+    assert not event.stderr, str(event.stderr)
     assert event.stopped is None
 
     (result,) = event.results()
@@ -139,7 +203,10 @@ def test_binary_result(confpatch, schedpatch):
 
     assert event.returncode == 0
 
-    assert gzip.decompress(bytes(event.stdout)) == confpatch.conf.task.binary.param.encode()
+    # (wbits: expect gzip header and trailer)
+    stdout = zlib.decompress(bytes(event.stdout), wbits=(16 + zlib.MAX_WBITS))
+
+    assert stdout == confpatch.conf.task.binary.param.encode()
 
     assert bytes(event.stderr) == b''
 
@@ -182,7 +249,7 @@ def test_large_result(confpatch, schedpatch):
 
     assert event.returncode == 0
 
-    assert str(event.stderr) == ''
+    assert not event.stderr, str(event.stderr)
 
     assert logs.field_equals(completed=1, total=1, active=0)
 
@@ -193,7 +260,10 @@ def test_large_result(confpatch, schedpatch):
 
     assert session.seconds < 5
 
-    assert len(bytes(event.stdout)) == HUNDRED_MB
+    assert len(event.stdout) == HUNDRED_MB
+
+    # completed output is held once -- cast to bytes without copy
+    assert bytes(event.stdout) is bytes(event.stdout)
 
 
 def test_invocation_failure(confpatch, schedpatch):
@@ -228,16 +298,27 @@ def test_invocation_failure(confpatch, schedpatch):
     assert str(fail_event.error) == 'command not found on path: fohdfskjh'
 
 
+LOG_EVENT_MESSAGES = (
+    "I'm just getting set up here...",
+    {'level': 'WARN', 'message': "NOW we're cookin'!"},
+    "...See ya'",
+)
+
+# second message as recorded (less its level, which is reported separately)
+LOG_EVENT_RECORD1 = {key: value for key, value in LOG_EVENT_MESSAGES[1].items() if key != 'level'}
+
+LOG_EVENT_STDERR = (f'<2> {LOG_EVENT_MESSAGES[0]}\0'
+                    f'<3> {json.dumps(LOG_EVENT_RECORD1)}\0'
+                    f'<2> {LOG_EVENT_MESSAGES[2]}\0')
+
+
 @timeout(2)
 def test_log_event(locking_task, confpatch, schedpatch):
     #
     # configure a locking task which writes log records to stderr
     #
-    msgs = (
-        "I'm just getting set up here...",
-        {'level': 'WARN', 'message': "NOW we're cookin'!"},
-        "...See ya'",
-    )
+    msgs = LOG_EVENT_MESSAGES
+
     confpatch.set_tasks(
         {
             'logs': {
@@ -284,9 +365,7 @@ def test_log_event(locking_task, confpatch, schedpatch):
 
     assert isinstance(log_event1, sched.TaskLogEvent)
 
-    record1 = {key: value for key, value in msgs[1].items() if key != 'level'}
-
-    assert log_event1.record() == ('WARNING', record1)
+    assert log_event1.record() == ('WARNING', LOG_EVENT_RECORD1)
 
     assert isinstance(log_event2, sched.TaskLogEvent)
 
@@ -298,11 +377,7 @@ def test_log_event(locking_task, confpatch, schedpatch):
 
     assert bytes(ready_event.stdout) == b'done\n'
 
-    message1 = json.dumps(record1)
-
-    assert str(ready_event.stderr) == (f'<2> {msgs[0]}\0'
-                                       f'<3> {message1}\0'
-                                       f'<2> {msgs[2]}\0')
+    assert str(ready_event.stderr) == LOG_EVENT_STDERR
 
     assert logs.field_equals(completed=0, total=0, active=1, events=1)
     assert logs.field_equals(completed=0, total=0, active=1, events=2)
@@ -422,7 +497,7 @@ def test_results_ext(confpatch, schedpatch):
     (event,) = events
     assert event.returncode == 0
     assert str(event.stdout) == 'done\n'
-    assert str(event.stderr) == ''
+    assert not event.stderr, str(event.stderr)
     assert event.stopped is None
 
     (result,) = event.results()
@@ -571,7 +646,20 @@ def test_timeout_noop(confpatch, schedpatch):
     assert logs.field_equals(completed=1, total=1, active=0)
 
 
-def test_timeout_child(confpatch, schedpatch):
+TIMEOUT_CHILD_SCRIPT = textwrap.dedent('''\
+    import os, time
+
+    print('started:', os.getpid(), os.getpgid(0), flush=True)
+
+    open(os.environ['TEST_TASK_READY'], 'x').close()
+
+    time.sleep(10)
+
+    print('finished')
+''')
+
+
+def test_timeout_child(timewarp, confpatch, schedpatch):
     #
     # configure a task with an impossible timeout created by a well-behaving child process
     #
@@ -582,15 +670,7 @@ def test_timeout_child(confpatch, schedpatch):
                 # but, this is not reliable -- so, we'll use python
                 'shell': {
                     'executable': 'python',
-                    'script': textwrap.dedent('''\
-                        import os, time
-
-                        print('started:', os.getpid(), os.getpgid(0), flush=True)
-
-                        time.sleep(10)
-
-                        print('finished')
-                    '''),
+                    'script': TIMEOUT_CHILD_SCRIPT,
                 },
                 'schedule': "H/5 * * * *",
                 'timeout': '1s',
@@ -606,8 +686,10 @@ def test_timeout_child(confpatch, schedpatch):
     #
     # execute scheduler with captured logs
     #
+    # (task timing runs on a sped-up clock)
+    #
     with confpatch.caplog() as logs, \
-         StopWatch() as session:
+         StopWatch(timewarp.time) as session:
         events = list(schedpatch.scheduler())
 
     #
@@ -622,7 +704,7 @@ def test_timeout_child(confpatch, schedpatch):
 
     assert event.returncode == -signal.SIGTERM
 
-    assert str(event.stderr) == ''
+    assert not event.stderr, str(event.stderr)
 
     assert logs.field_equals(completed=1, total=1, active=0)
 
@@ -633,10 +715,7 @@ def test_timeout_child(confpatch, schedpatch):
     assert 1 <= session.seconds < 2
 
     # we shouldn't see "finished"
-    stdout_match = re.fullmatch(
-        r'started: (?P<cpid>\d+) +(?P<cpgid>\d+)\n',
-        str(event.stdout)
-    )
+    stdout_match = STDOUT_CHILD.fullmatch(event.stdout.data)
 
     assert stdout_match, str(event.stdout)
 
@@ -650,7 +729,22 @@ def test_timeout_child(confpatch, schedpatch):
         os.killpg(cpgid, 0)
 
 
-def test_timeout_child_trap(confpatch, schedpatch):
+TIMEOUT_CHILD_TRAP_SCRIPT = textwrap.dedent('''\
+    import os, signal, time
+
+    print('started:', os.getpid(), os.getpgid(0), flush=True)
+
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+    open(os.environ['TEST_TASK_READY'], 'x').close()
+
+    time.sleep(10)
+
+    print('finished')
+''')
+
+
+def test_timeout_child_trap(timewarp, confpatch, schedpatch):
     #
     # configure a task with an impossible timeout created by a misbehaving child process
     #
@@ -661,17 +755,7 @@ def test_timeout_child_trap(confpatch, schedpatch):
                 # but, this is not reliable -- so, we'll use python
                 'shell': {
                     'executable': 'python',
-                    'script': textwrap.dedent('''\
-                        import os, signal, time
-
-                        print('started:', os.getpid(), os.getpgid(0), flush=True)
-
-                        signal.signal(signal.SIGTERM, signal.SIG_IGN)
-
-                        time.sleep(10)
-
-                        print('finished')
-                    '''),
+                    'script': TIMEOUT_CHILD_TRAP_SCRIPT,
                 },
                 'schedule': "H/5 * * * *",
                 'timeout': '1s',
@@ -687,8 +771,10 @@ def test_timeout_child_trap(confpatch, schedpatch):
     #
     # execute scheduler with captured logs
     #
+    # (task timing runs on a sped-up clock)
+    #
     with confpatch.caplog() as logs, \
-         StopWatch() as session:
+         StopWatch(timewarp.time) as session:
         events = list(schedpatch.scheduler())
 
     #
@@ -700,7 +786,7 @@ def test_timeout_child_trap(confpatch, schedpatch):
 
     assert event.returncode == -signal.SIGKILL
 
-    assert str(event.stderr) == ''
+    assert not event.stderr, str(event.stderr)
 
     assert logs.field_equals(completed=1, total=1, active=0)
 
@@ -711,10 +797,7 @@ def test_timeout_child_trap(confpatch, schedpatch):
     assert 1 <= session.seconds < 2
 
     # we shouldn't see "finished"
-    stdout_match = re.fullmatch(
-        r'started: (?P<cpid>\d+) +(?P<cpgid>\d+)\n',
-        str(event.stdout)
-    )
+    stdout_match = STDOUT_CHILD.fullmatch(event.stdout.data)
 
     assert stdout_match, str(event.stdout)
 
@@ -728,7 +811,7 @@ def test_timeout_child_trap(confpatch, schedpatch):
         os.killpg(cpgid, 0)
 
 
-def test_timeout_grandchild(confpatch, schedpatch):
+def test_timeout_grandchild(timewarp, confpatch, schedpatch):
     #
     # configure a task with an impossible timeout created by a well-behaving --
     # but file descriptor-inheriting -- grandchild process.
@@ -743,6 +826,7 @@ def test_timeout_grandchild(confpatch, schedpatch):
                     sh -c '
                         pgid="$(ps -o pgid= -p $$)"
                         echo "grandchild: $$ $pgid"
+                        touch "$TEST_TASK_READY"
                         sleep 10
                     '
 
@@ -762,8 +846,10 @@ def test_timeout_grandchild(confpatch, schedpatch):
     #
     # execute scheduler with captured logs
     #
+    # (task timing runs on a sped-up clock)
+    #
     with confpatch.caplog() as logs, \
-         StopWatch() as session:
+         StopWatch(timewarp.time) as session:
         events = list(schedpatch.scheduler())
 
     #
@@ -775,7 +861,7 @@ def test_timeout_grandchild(confpatch, schedpatch):
 
     assert event.returncode == -signal.SIGTERM
 
-    assert str(event.stderr) == ''
+    assert not event.stderr, str(event.stderr)
 
     assert logs.field_equals(completed=1, total=1, active=0)
 
@@ -786,11 +872,7 @@ def test_timeout_grandchild(confpatch, schedpatch):
     assert 1 <= session.seconds < 2
 
     # we shouldn't see "finished"
-    stdout_match = re.fullmatch(
-        r'started: (?P<cpid>\d+) +(?P<cpgid>\d+)\n'
-        r'grandchild: (?P<gpid>\d+) +(?P<gpgid>\d+)\n',
-        str(event.stdout)
-    )
+    stdout_match = STDOUT_GRANDCHILD.fullmatch(event.stdout.data)
 
     assert stdout_match, str(event.stdout)
 
@@ -814,7 +896,24 @@ def test_timeout_grandchild(confpatch, schedpatch):
         os.killpg(cpgid, 0)
 
 
-def test_timeout_grandchild_trap(confpatch, schedpatch):
+TIMEOUT_GRANDCHILD_TRAP_SCRIPT = textwrap.dedent('''\
+    python <<<"
+    import os, signal, time
+
+    print('started:', os.getpid(), os.getpgid(0), flush=True)
+
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+
+    open(os.environ['TEST_TASK_READY'], 'x').close()
+
+    time.sleep(10)
+
+    print('finished')
+    "
+''')
+
+
+def test_timeout_grandchild_trap(timewarp, confpatch, schedpatch):
     #
     # configure a task with an impossible timeout created by a misbehaving --
     # and file descriptor-inheriting -- grandchild process.
@@ -827,19 +926,7 @@ def test_timeout_grandchild_trap(confpatch, schedpatch):
                 # subprocess via "shell" (like: sh -c 'python -c ...')
                 'shell': {
                     'executable': 'bash',
-                    'script': textwrap.dedent('''\
-                        python <<<"
-                        import os, signal, time
-
-                        print('started:', os.getpid(), os.getpgid(0), flush=True)
-
-                        signal.signal(signal.SIGTERM, signal.SIG_IGN)
-
-                        time.sleep(10)
-
-                        print('finished')
-                        "
-                    '''),
+                    'script': TIMEOUT_GRANDCHILD_TRAP_SCRIPT,
                 },
                 'schedule': "H/5 * * * *",
                 'timeout': '1s',
@@ -855,8 +942,10 @@ def test_timeout_grandchild_trap(confpatch, schedpatch):
     #
     # execute scheduler with captured logs
     #
+    # (task timing runs on a sped-up clock)
+    #
     with confpatch.caplog() as logs, \
-         StopWatch() as session:
+         StopWatch(timewarp.time) as session:
         events = list(schedpatch.scheduler())
 
     #
@@ -868,7 +957,7 @@ def test_timeout_grandchild_trap(confpatch, schedpatch):
 
     assert event.returncode == -signal.SIGTERM
 
-    assert str(event.stderr) == ''
+    assert not event.stderr, str(event.stderr)
 
     assert logs.field_equals(completed=1, total=1, active=0)
 
@@ -879,10 +968,7 @@ def test_timeout_grandchild_trap(confpatch, schedpatch):
     assert 1 <= session.seconds < 2
 
     # we shouldn't see "finished"
-    stdout_match = re.fullmatch(
-        r'started: (?P<gpid>\d+) +(?P<gpgid>\d+)\n',
-        str(event.stdout)
-    )
+    stdout_match = STDOUT_GRANDCHILD_TRAP.fullmatch(event.stdout.data)
 
     assert stdout_match, str(event.stdout)
 
@@ -997,7 +1083,7 @@ def test_refill_primary_cohort(locking_task, confpatch, schedpatch, monkeypatch,
         assert isinstance(event1, sched.TaskReadyEvent)
         assert event1.returncode == 0
         assert str(event1.stdout) == locking_task.result
-        assert str(event1.stderr) == ''
+        assert not event1.stderr, str(event1.stderr)
 
         assert logs.field_equals(level='debug', completed=1, total=1, active=1)
         assert logs.field_equals(level='debug', completed=1, total=2, active=0)
@@ -1086,7 +1172,7 @@ def test_refill_secondary_cohort(locking_task, confpatch, schedpatch, monkeypatc
         assert event0.task.__name__ == 'runs-long'
         assert isinstance(event0, sched.TaskReadyEvent)
         assert str(event0.stdout) == locking_task.result
-        assert str(event0.stderr) == ''
+        assert not event0.stderr, str(event0.stderr)
 
         assert logs.field_equals(level='debug', cohort=0, size=2, msg="enqueued cohort")
         assert logs.field_equals(level='debug', active=1, msg="launched pool")